@@ -20,101 +20,212 @@
 This example provides functionality to routinely book personal spaces with Condeco®.
 """
 
+# We run the booking attempts concurrently.
+import asyncio
+
 # We manipulate dates.
 import datetime
 
-# This script makes heavy use of JSON parsing.
-import json
+# We add jitter to the retry delays.
+import random
 
 # We handle connection errors.
-import requests
+import aiohttp
 
-# We delay.
-import time
+# We handle expired tokens.
+import jwt
 
 # All the shared Condeco® functions are in this package.
 from hybrid_worker.condeco import Condeco
+from hybrid_worker.condeco_async import AsyncCondeco
 
-def book_week(condeco, candidate_dates):
-    # Try for around 120 seconds (server delay/retries make it longer).
-    for _ in range(120):
-
-        # Leave when there is nothing further to do.
-        if not candidate_dates:
-            return True
-
-        # Get the first candidate date.
-        candidate_date = candidate_dates.pop(0)
-
-        # Notify user.
-        print(f'{datetime.datetime.now()} - Booking for {candidate_date}:', flush=True)
-
-        try:
-            # Attempt to book.
-            if not book_single_day(condeco, candidate_date):
-                # We will come back to this date.
-                candidate_dates.append(candidate_date)
-
-                # Wait 1 second.
-                time.sleep(1)
-        except requests.exceptions.ConnectionError:
-                # Notify the user.
-                print(f'{datetime.datetime.now()} -  * Failure due to repeated connection errors.', flush=True)
-
-                # We will come back to this date.
-                candidate_dates.append(candidate_date)
-
-        # Add a new line.
-        print(flush=True)
+# This script makes heavy use of JSON parsing.
+from hybrid_worker import serialisation
 
-    # Not able to book all dates within the time allocated.
-    return False
+# Failed booking attempts are retried with a truncated exponential backoff (in seconds).
+RETRY_ATTEMPTS = 10
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 60
 
-def book_single_day(condeco, candidate_date):
-    # Format candidate_date.
-    date_string = candidate_date.strftime('%d/%m/%Y')
+# Every desk is booked for the whole day (bookDesk expects this after the date).
+ALL_DAY_SUFFIX = '|' + str(Condeco.BOOKING_TYPE['AllDay'])
 
-    # searchDeskByFeatures
-    desk_search_request_with_features = {
+async def book_week(condeco, candidate_dates):
+    # The search request only varies by date.
+    desk_search_request = {
         'accessToken': configuration['authentication']['sessionToken'],
         'locationID': configuration['auto_book']['location_id'],
         'groupID': configuration['auto_book']['group_id'],
         'floorID': configuration['auto_book']['floor_id'],
         'bookingType': Condeco.BOOKING_TYPE['None'],
-        'startDate': date_string,
         'userID': configuration['auto_book']['user_id'],
         'deskAttributes': [],
         'wsTypeID': configuration['auto_book']['ws_type_id']
     }
 
-    response = condeco.searchDeskByFeatures(
+    # What the latest search found for each date (so a change in availability can be noticed).
+    search_states = {}
+
+    # Wait a random moment first so clients started on the same schedule do not all arrive at once.
+    await asyncio.sleep(random.uniform(0, configuration['auto_book'].get('startup_jitter', 0.5)))
+
+    # Each date is booked (and retried) independently of the others.
+    results = await asyncio.gather(
+        *(book_date(condeco, desk_search_request, candidate_date, search_states) for candidate_date in candidate_dates)
+    )
+
+    # Were all the dates booked?
+    return all(results)
+
+async def book_date(condeco, desk_search_request, candidate_date, search_states):
+    # Format candidate_date once.
+    date_string = candidate_date.strftime('%d/%m/%Y')
+
+    # How many times the retry delay has doubled.
+    backoff = 0
+
+    # Try a limited number of times (waiting longer after each failed attempt).
+    for attempt in range(RETRY_ATTEMPTS):
+
+        # Notify user.
+        print(f'{datetime.datetime.now()} - Booking for {candidate_date}:', flush=True)
+
+        previous_search_state = search_states.get(candidate_date)
+        try:
+            # Attempt to book.
+            if await book_single_day(condeco, desk_search_request, candidate_date, date_string, search_states):
+                # We now have a booking for this day.
+                return True
+        except aiohttp.ClientConnectionError:
+            # Notify the user.
+            print(f'{datetime.datetime.now()} -  * {date_string}: Failure due to a connection error.', flush=True)
+        except jwt.ExpiredSignatureError:
+            # Retrying cannot help once the token has expired.
+            print(f'{datetime.datetime.now()} -  * {date_string}: Failure due to the token having expired.', flush=True)
+            return False
+
+        # Poll again quickly while desks are being released or taken, otherwise back off further.
+        if search_states.get(candidate_date) != previous_search_state:
+            backoff = 0
+
+        # Wait before retrying (the "full jitter" stops every client retrying at exactly the same time).
+        if attempt + 1 < RETRY_ATTEMPTS:
+            delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** backoff))
+            backoff += 1
+            print(f'{datetime.datetime.now()} -  * {date_string}: Retrying in {delay:.1f} seconds.', flush=True)
+            await asyncio.sleep(delay)
+
+    # Not able to book this date within the attempts allocated.
+    print(f'{datetime.datetime.now()} - Giving up on {candidate_date} after {RETRY_ATTEMPTS} attempts.', flush=True)
+    return False
+
+async def book_single_day(condeco, desk_search_request, candidate_date, date_string, search_states):
+    # searchDeskByFeatures
+    desk_search_request_with_features = {**desk_search_request, 'startDate': date_string}
+
+    response = await condeco.searchDeskByFeatures(
         access_token=configuration['authentication']['token'],
         desk_search_request_with_features=desk_search_request_with_features
     )
 
     # Parse the response as JSON.
-    response_json = response.json()
+    response_json = await response.json(loads=serialisation.loads, content_type=None)
+
+    # Record the outcome of the search.
+    search_states[candidate_date] = (response_json['CallResponse']['ResponseCode'], 0)
 
     # Did we return desks?
     if response_json['CallResponse']['ResponseCode'] != 100:
-        print(f'{datetime.datetime.now()} -  * Failure due to "{response_json["CallResponse"]["ResponseMessage"]}".', flush=True)
+        print(f'{datetime.datetime.now()} -  * {date_string}: Failure due to "{response_json["CallResponse"]["ResponseMessage"]}".', flush=True)
         return False
 
-    # Take each of the desks.
-    for desk in response_json['SearchedDesks']:
-        # Check the desk is available for booking.
-        if desk['CanBeBooked']:
-            # About to book.
-            print(f'{datetime.datetime.now()} -  * Attempting to book "{desk["DeskName"]}" (#{desk["DeskID"]}).', flush=True)
+    # Only the desks that are available for booking are of interest.
+    bookable_desks = [desk for desk in response_json['SearchedDesks'] if desk['CanBeBooked']]
+    search_states[candidate_date] = (response_json['CallResponse']['ResponseCode'], len(bookable_desks))
 
-            # Attempt booking.
-            if book_desk(condeco, date_string, desk['DeskID']):
-                # We now have a booking for this day.
-                return True
+    # Leave early if there is nothing to book.
+    if not bookable_desks:
+        print(f'{datetime.datetime.now()} -  * {date_string}: Failure due to no desks being available.', flush=True)
+        return False
+
+    # How many desks to attempt to book at the same time (any extra bookings are then released).
+    parallel_desks = configuration['auto_book'].get('parallel_desks', 1)
+
+    # Take each batch of desks.
+    for index in range(0, len(bookable_desks), parallel_desks):
+        # Attempt booking.
+        if await book_any_desk(condeco, date_string, bookable_desks[index:index + parallel_desks]):
+            # We now have a booking for this day.
+            return True
+
+    # None of the desks could be booked.
+    return False
+
+async def book_any_desk(condeco, date_string, desks):
+    # About to book.
+    for desk in desks:
+        print(f'{datetime.datetime.now()} -  * {date_string}: Attempting to book "{desk["DeskName"]}" (#{desk["DeskID"]}).', flush=True)
+
+    # Race the bookings (a desk released moments ago is often claimed by someone else first).
+    # Every attempt is waited for, as cancelling one does not undo a booking the server has already made.
+    results = await asyncio.gather(
+        *(book_desk(condeco, date_string, desk['DeskID']) for desk in desks),
+        return_exceptions=True
+    )
+
+    # The bookings that succeeded (with their booking identifiers).
+    bookings = [(desk, result) for desk, result in zip(desks, results) if result and not isinstance(result, BaseException)]
+
+    # Only one desk is needed for the day, so release any others that were also booked.
+    for desk, booking_id in bookings[1:]:
+        await release_desk(condeco, date_string, desk['DeskID'], booking_id)
+
+    # Did any of the desks get booked?
+    if bookings:
+        return True
 
-def book_desk(condeco, date_string, desk_id):
+    # Report connection errors to the caller so they can be retried.
+    for result in results:
+        if isinstance(result, aiohttp.ClientConnectionError):
+            raise result
+
+    # Any other exception is unexpected.
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+    # None of the desks could be booked.
+    return False
+
+async def release_desk(condeco, date_string, desk_id, booking_id):
+    # Without the booking details the booking cannot be deleted.
+    if booking_id is True:
+        print(f'{datetime.datetime.now()} -  * {date_string}: Unable to release the extra booking of #{desk_id} (remove it manually).', flush=True)
+        return
+
+    # deleteBooking
+    response = await condeco.deleteBooking(
+        access_token=configuration['authentication']['token'],
+        session_token=configuration['authentication']['sessionToken'],
+        booking_id=booking_id,
+        desk_id=desk_id,
+        start_date=date_string + ' 00:00 AM',
+        end_date=date_string + ' 23:59 PM',
+        booking_type=Condeco.BOOKING_TYPE['AllDay']
+    )
+
+    # Parse the response as JSON.
+    response_json = await response.json(loads=serialisation.loads, content_type=None)
+
+    # Was it released?
+    if response_json['CallResponse']['ResponseCode'] == 100:
+        print(f'{datetime.datetime.now()} -  * {date_string}: Released extra booking #{booking_id}.', flush=True)
+    else:
+        print(f'{datetime.datetime.now()} -  * {date_string}: Unable to release extra booking #{booking_id} due to "{response_json["CallResponse"]["ResponseMessage"]}" (remove it manually).', flush=True)
+
+async def book_desk(condeco, date_string, desk_id):
     # bookDesk
-    response = condeco.bookDesk(
+    response = await condeco.bookDesk(
         access_token=configuration['authentication']['token'],
         session_token=configuration['authentication']['sessionToken'],
         user_id=None,
@@ -122,27 +233,29 @@ def book_desk(condeco, date_string, desk_id):
         group_id=configuration['auto_book']['group_id'],
         floor_id=configuration['auto_book']['floor_id'],
         desk_id=desk_id,
-        start_date=date_string + '|' + str(Condeco.BOOKING_TYPE['AllDay'])
+        start_date=date_string + ALL_DAY_SUFFIX
     )
 
     # Parse the response as JSON.
-    response_json = response.json()
+    response_json = await response.json(loads=serialisation.loads, content_type=None)
 
     # Did it get booked?
     if response_json['CallResponse']['ResponseCode'] == 100:
         # Succeeded.
         if len(response_json["CreatedBookings"]) > 0:
-            print(f'{datetime.datetime.now()} -  * Booked #{response_json["CreatedBookings"][0]["BookingID"]}.', flush=True)
+            booking_id = response_json["CreatedBookings"][0]["BookingID"]
+            print(f'{datetime.datetime.now()} -  * {date_string}: Booked #{booking_id}.', flush=True)
+            return booking_id
         else:
             # Sometimes API does not return booking details.
-            print(f'{datetime.datetime.now()} -  * Booked.', flush=True)
-        return True
+            print(f'{datetime.datetime.now()} -  * {date_string}: Booked.', flush=True)
+            return True
     else:
         # Failure.
-        print(f'{datetime.datetime.now()} -  * Failure due to "{response_json["CallResponse"]["ResponseMessage"]}".', flush=True)
+        print(f'{datetime.datetime.now()} -  * {date_string}: Failure due to "{response_json["CallResponse"]["ResponseMessage"]}".', flush=True)
         return False
 
-def main():
+async def main():
     """
     Main function for automatic booking.
 
@@ -154,51 +267,59 @@ def main():
     """
 
     # Load configuration.
-    with open('configuration.json', mode='r', encoding='utf-8') as json_file:
+    with open('configuration.json', mode='rb') as json_file:
         global configuration
-        configuration = json.load(json_file)
-
-    # Create an initialised Condeco® object.
-    condeco = Condeco(unique_key=configuration['authentication']['unique_key'])
-
-    # Do we already have a token to use the app?
-    if configuration['authentication'].get('token'):
-        # Add 3 weeks to the current Monday.
-        current_date = datetime.date.today()
-        start_of_week = current_date + datetime.timedelta(days=-current_date.weekday(), weeks=3)
-
-        # Gather the Monday and Friday dates to book for.
-        candidate_dates = [ start_of_week + datetime.timedelta(days=4), start_of_week ]
-        print(f'{datetime.datetime.now()} - Starting booking for {", ".join(map(str, candidate_dates))}.\n', flush=True)
-
-        # Check JWT.
-        decoded_jwt = Condeco.decode_jwt(configuration['authentication']['token'])
-        expiry_date = datetime.datetime.fromtimestamp(decoded_jwt['exp'])
-        time_delta = expiry_date - datetime.datetime.now()
-        print(f'{datetime.datetime.now()} - Token expires in {time_delta}.\n', flush=True)
-
-        # Perform the booking attempts.
-        if book_week(condeco=condeco, candidate_dates=candidate_dates):
-            print(f'{datetime.datetime.now()} - Finished, booking completed successfully.', flush=True)
+        configuration = serialisation.loads(json_file.read())
+
+    # Create an initialised Condeco® object (sharing one session for the whole run).
+    async with AsyncCondeco(
+        unique_key=configuration['authentication']['unique_key'],
+        max_concurrency=configuration.get('auto_book', {}).get('max_concurrency', 8)
+    ) as condeco:
+        # Do we already have a token to use the app?
+        if configuration['authentication'].get('token'):
+            # Add 3 weeks to the current Monday.
+            current_date = datetime.date.today()
+            start_of_week = current_date + datetime.timedelta(days=-current_date.weekday(), weeks=3)
+
+            # Gather the Monday and Friday dates to book for.
+            candidate_dates = [ start_of_week + datetime.timedelta(days=4), start_of_week ]
+            print(f'{datetime.datetime.now()} - Starting booking for {", ".join(map(str, candidate_dates))}.\n', flush=True)
+
+            # Check JWT.
+            try:
+                decoded_jwt = Condeco.decode_jwt(configuration['authentication']['token'])
+            except jwt.ExpiredSignatureError:
+                # There is no point attempting to book with an expired token.
+                print(f'{datetime.datetime.now()} - Finished, the token has expired (remove it from configuration.json to obtain a new one).\n', flush=True)
+                return
+
+            expiry_date = datetime.datetime.fromtimestamp(decoded_jwt['exp'])
+            time_delta = expiry_date - datetime.datetime.now()
+            print(f'{datetime.datetime.now()} - Token expires in {time_delta}.\n', flush=True)
+
+            # Perform the booking attempts.
+            if await book_week(condeco=condeco, candidate_dates=candidate_dates):
+                print(f'{datetime.datetime.now()} - Finished, booking completed successfully.', flush=True)
+            else:
+                print(f'{datetime.datetime.now()} - Finished, unable to book one or more spaces.', flush=True)
+
+            # Add a new line.
+            print(flush=True)
+        # Is the user wanting to validate a validation key?
+        elif configuration['authentication'].get('validation_key'):
+            # Validate the validation key and return a token.
+            response = await condeco.loginWithMagicLink(
+                validation_key=configuration['authentication']['validation_key']
+            )
+            print(await response.text(), flush=True)
         else:
-            print(f'{datetime.datetime.now()} - Finished, unable to book one or more spaces.', flush=True)
-
-        # Add a new line.
-        print(flush=True)
-    # Is the user wanting to validate a validation key?
-    elif configuration['authentication'].get('validation_key'):
-        # Validate the validation key and return a token.
-        response = condeco.loginWithMagicLink(
-            validation_key=configuration['authentication']['validation_key']
-        )
-        print(response.text, flush=True)
-    else:
-        # Send a validation key to this user.
-        response = condeco.sendMagicLink(
-            email=configuration['authentication']['email']
-        )
-        print(response.text, flush=True)
+            # Send a validation key to this user.
+            response = await condeco.sendMagicLink(
+                email=configuration['authentication']['email']
+            )
+            print(await response.text(), flush=True)
 
 # Launch the main method if invoked directly.
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
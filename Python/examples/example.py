@@ -20,62 +20,87 @@
 This example provides functionality to interact with the Condeco® software.
 """
 
+# We parse the command line arguments.
+import argparse
+
+# We run independent examples at the same time.
+import asyncio
+
 # We manipulate dates.
 import datetime
 
-# This script makes heavy use of JSON parsing.
-import json
+# We locate the cache in the user's home directory.
+import os
+
+# We write response bodies directly to the standard output.
+import sys
 
 # All the shared Condeco® functions are in this package.
 from hybrid_worker.condeco import Condeco
 
+# This script makes heavy use of JSON parsing.
+from hybrid_worker import serialisation
+
+# Responses from the rarely changing endpoints can be cached on disk between runs;
+# "pip install requests-cache" to use it.
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# How long (in seconds) each rarely changing endpoint is cached for (only these unauthenticated endpoints are cached,
+# as many GET requests change bookings and the others carry session tokens that would be written to disk).
+CACHE_EXPIRY = {
+    '*/DeskBookingService.svc/Configuration/GetGlobalSettings': 86400,
+    '*/MobileService.svc/Configuration/GetGlobalSettings': 86400,
+    '*/api/systeminfo': 86400
+}
+
 #region Examples
 
 def bookDesk():
     # bookDesk
     response = condeco.bookDesk(
-        access_token=configuration['authentication']['token'],
-        session_token=configuration['authentication']['sessionToken'],
+        access_token=authentication['token'],
+        session_token=authentication['sessionToken'],
         user_id=None,
-        location_id=configuration['examples']['location_id'],
-        group_id=configuration['examples']['group_id'],
-        floor_id=configuration['examples']['floor_id'],
-        desk_id=configuration['examples']['desk_id'],
-        start_date=next_weekday(datetime.date.today(), 5).strftime('%d/%m/%Y') + '|' + str(Condeco.BOOKING_TYPE['AllDay'])
+        location_id=examples['location_id'],
+        group_id=examples['group_id'],
+        floor_id=examples['floor_id'],
+        desk_id=examples['desk_id'],
+        start_date=dates['next_saturday'] + '|' + str(Condeco.BOOKING_TYPE['AllDay'])
     )
-    print(response.text)
+    print_body(response.content)
 
 def cancelBooking():
     # cancelBooking
     delete_booking = {
-        'sessionGuid':configuration['authentication']['sessionToken'],
-        'UserID':configuration['authentication']['sessionToken'],
+        'sessionGuid':authentication['sessionToken'],
+        'UserID':authentication['sessionToken'],
         'languageID':1,
-        'token':configuration['authentication']['sessionToken'],
-        'bookingID':[configuration['examples']['room_booking_id']],
+        'token':authentication['sessionToken'],
+        'bookingID':[examples['room_booking_id']],
     }
 
     response = condeco.cancelBooking(
-        access_token=configuration['authentication']['token'],
+        access_token=authentication['token'],
         delete_booking=delete_booking
     )
-    print(response.text)
+    print_body(response.content)
 
 def createBooking():
-    midnight_today = datetime.datetime.combine(datetime.date.today(), datetime.datetime.min.time())
-
     # createBooking
     add_booking = {
-        'sessionGuid':configuration['authentication']['sessionToken'],
-        'UserID':configuration['authentication']['sessionToken'],
-        'token':configuration['authentication']['sessionToken'],
+        'sessionGuid':authentication['sessionToken'],
+        'UserID':authentication['sessionToken'],
+        'token':authentication['sessionToken'],
         'roomBooking':{
-            'RoomID':configuration['examples']['room_id'],
+            'RoomID':examples['room_id'],
             'LocationName':'Location Name',
             'RoomName':'Room Name',
             'MeetingTitle':'Meeting Title',
             'TimeZone':'GMT Standard Time',
-            'TimeTo':'/Date(' + str(int((midnight_today + datetime.timedelta(hours=17, minutes=15)).timestamp()*1000)) + ')/',
+            'TimeTo':dates['meeting_to'],
             'countryName':'Country Name',
             'locationID':[],
             'NumAttending':1,
@@ -83,223 +108,223 @@ def createBooking():
             'LanguageID':1,
             'floorName':'',
             'FloorNumber':0,
-            'TimeFrom':'/Date(' + str(int((midnight_today + datetime.timedelta(hours=17)).timestamp()*1000)) + ')/'
+            'TimeFrom':dates['meeting_from']
         }
     }
 
     response = condeco.createBooking(
-        access_token=configuration['authentication']['token'],
+        access_token=authentication['token'],
         add_booking=add_booking
     )
-    print(response.text)
+    print_body(response.content)
 
 def deleteBooking():
     # deleteBooking
     response = condeco.deleteBooking(
-        access_token=configuration['authentication']['token'],
-        session_token=configuration['authentication']['sessionToken'],
-        booking_id=configuration['examples']['booking_id'],
-        desk_id=configuration['examples']['desk_id'],
-        start_date=next_weekday(datetime.date.today(), 5).strftime('%d/%m/%Y') + ' 00:00 AM',
-        end_date=next_weekday(datetime.date.today(), 5).strftime('%d/%m/%Y') + ' 23:59 PM',
+        access_token=authentication['token'],
+        session_token=authentication['sessionToken'],
+        booking_id=examples['booking_id'],
+        desk_id=examples['desk_id'],
+        start_date=dates['next_saturday'] + ' 00:00 AM',
+        end_date=dates['next_saturday'] + ' 23:59 PM',
         booking_type=Condeco.BOOKING_TYPE['AllDay']
     )
-    print(response.text)
+    print_body(response.content)
 
 def deskGlobalSettings():
     # deskGlobalSettings
     response = condeco.deskGlobalSettings()
-    print(response.text)
+    print_body(response.content)
 
 def deskSystemInfo():
     # deskSystemInfo
     response = condeco.deskSystemInfo()
-    print(response.text)
+    print_body(response.content)
 
 def findColleagues():
     # findColleagues
     response = condeco.findColleagues(
-        access_token=configuration['authentication']['token'],
-        session_token=configuration['authentication']['sessionToken'],
-        name=configuration['examples']['name']
+        access_token=authentication['token'],
+        session_token=authentication['sessionToken'],
+        name=examples['name']
     )
-    print(response.text)
+    print_body(response.content)
 
 def getAttendancesRecord():
     # getAttendancesRecord
     response = condeco.getAttendancesRecord(
-        access_token=configuration['authentication']['token'],
-        session_token=configuration['authentication']['sessionToken'],
-        start_date=datetime.date.today().strftime('%d/%m/%Y'),
-        end_date=(datetime.date.today() + datetime.timedelta(14)).strftime('%d/%m/%Y'),
+        access_token=authentication['token'],
+        session_token=authentication['sessionToken'],
+        start_date=dates['today'],
+        end_date=dates['next_fortnight'],
         user_id=-1
     )
-    print(response.text)
+    print_body(response.content)
 
 def getColleagueBookings():
     # getColleagueBookings
     response = condeco.getColleagueBookings(
-        access_token=configuration['authentication']['token'],
-        session_token=configuration['authentication']['sessionToken'],
-        start_date=datetime.date.today().strftime('%d/%m/%Y'),
-        end_date=(datetime.date.today() + datetime.timedelta(7)).strftime('%d/%m/%Y'),
+        access_token=authentication['token'],
+        session_token=authentication['sessionToken'],
+        start_date=dates['today'],
+        end_date=dates['next_week'],
         time_zone_id='""',
-        user_id=configuration['examples']['user_id_other']
+        user_id=examples['user_id_other']
     )
-    print(response.text)
+    print_body(response.content)
 
 def getDeskSessionToken():
     # getDeskSessionToken (V2)
     response = condeco.getDeskSessionToken(
-        access_token=configuration['authentication']['token']
+        access_token=authentication['token']
     )
-    print(response.text)
+    print_body(response.content)
 
 def getFloorPlan():
     # getFloorPlan
     response = condeco.getFloorPlan(
-        access_token=configuration['authentication']['token'],
-        session_token=configuration['authentication']['sessionToken'],
-        location_id=configuration['examples']['location_id'],
-        group_id=configuration['examples']['group_id'],
-        floor_id=configuration['examples']['floor_id']
+        access_token=authentication['token'],
+        session_token=authentication['sessionToken'],
+        location_id=examples['location_id'],
+        group_id=examples['group_id'],
+        floor_id=examples['floor_id']
     )
-    print(response.text)
+    print_body(response.content)
 
 def getGroupSettingsWithRestrictions():
     # getGroupSettingsWithRestrictions
     response = condeco.getGroupSettingsWithRestrictions(
-        access_token=configuration['authentication']['token'],
-        session_token=configuration['authentication']['sessionToken'],
+        access_token=authentication['token'],
+        session_token=authentication['sessionToken'],
         booking_for_user_id=-1,
-        location_id=configuration['examples']['location_id'],
-        group_ids=configuration['examples']['group_id']
+        location_id=examples['location_id'],
+        group_ids=examples['group_id']
     )
-    print(response.text)
+    print_body(response.content)
 
 def getLoginInformation():
     # getLoginInformation
     response = condeco.getLoginInformation(
-        access_token=configuration['authentication']['token'],
-        session_token=configuration['authentication']['sessionToken'],
+        access_token=authentication['token'],
+        session_token=authentication['sessionToken'],
         language_id=1,
-        current_date_time=datetime.datetime.now().strftime('%d/%m/%Y'),
+        current_date_time=dates['today'],
         current_culture='en-GB'
     )
-    print(response.text)
+    print_body(response.content)
 
 def getMyTeams():
     # getMyTeams
     response = condeco.getMyTeams(
-        access_token=configuration['authentication']['token'],
-        user_long_id=configuration['authentication']['sessionToken']
+        access_token=authentication['token'],
+        user_long_id=authentication['sessionToken']
     )
-    print(response.text)
+    print_body(response.content)
 
 def getRoomAvailabilities():
     # getRoomAvailabilities
     room_request = {
-        'UserID':configuration['authentication']['sessionToken'],
-        'sessionGuid':configuration['authentication']['sessionToken'],
-        'roomIds':[configuration['examples']['room_id']],
-        'date':(next_weekday(datetime.datetime.today(), 5) + datetime.timedelta(hours=17)).strftime('%Y-%m-%dT%H:%M:%SZ'),
-        'token':configuration['authentication']['sessionToken'],
+        'UserID':authentication['sessionToken'],
+        'sessionGuid':authentication['sessionToken'],
+        'roomIds':[examples['room_id']],
+        'date':dates['next_saturday_from'],
+        'token':authentication['sessionToken'],
     }
 
     response = condeco.getRoomAvailabilities(
-        access_token=configuration['authentication']['token'],
+        access_token=authentication['token'],
         room_request=room_request
     )
-    print(response.text)
+    print_body(response.content)
 
 def getRoomInfos():
     # getRoomInfos
     room_request = {
-        'roomIds':[configuration['examples']['room_id']],
-        'sessionGuid':configuration['authentication']['sessionToken'],
+        'roomIds':[examples['room_id']],
+        'sessionGuid':authentication['sessionToken'],
         'currentCulture':'en-GB',
-        'token':configuration['authentication']['sessionToken'],
-        'UserID':configuration['authentication']['sessionToken']
+        'token':authentication['sessionToken'],
+        'UserID':authentication['sessionToken']
     }
 
     response = condeco.getRoomInfos(
-        access_token=configuration['authentication']['token'],
+        access_token=authentication['token'],
         room_request=room_request
     )
-    print(response.text)
+    print_body(response.content)
 
 def getSessionToken():
     # getSessionToken
     response = condeco.getSessionToken(
-        access_token=configuration['authentication']['token']
+        access_token=authentication['token']
     )
-    print(response.text)
+    print_body(response.content)
 
 def globalSettings():
     # globalSettings
     response = condeco.globalSettings()
-    print(response.text)
+    print_body(response.content)
 
 def listBookings():
     # listBookings
     response = condeco.listBookings(
-        access_token=configuration['authentication']['token'],
-        session_token=configuration['authentication']['sessionToken'],
+        access_token=authentication['token'],
+        session_token=authentication['sessionToken'],
         language_id=1,
-        desk_start_date=datetime.date.today().strftime('%d/%m/%Y'),
-        desk_end_date=(datetime.date.today() + datetime.timedelta(7)).strftime('%d/%m/%Y'),
-        room_start_date=datetime.date.today().strftime('%d/%m/%Y'),
+        desk_start_date=dates['today'],
+        desk_end_date=dates['next_week'],
+        room_start_date=dates['today'],
         time_zone_id=2,
         page_index=0,
         page_size=50
     )
-    print(response.text)
+    print_body(response.content)
 
 def releaseDesk():
     # releaseDesk
     response = condeco.releaseDesk(
-        access_token=configuration['authentication']['token'],
-        session_token=configuration['authentication']['sessionToken'],
-        location_id=configuration['examples']['location_id'],
-        desk_id=configuration['examples']['desk_id'],
+        access_token=authentication['token'],
+        session_token=authentication['sessionToken'],
+        location_id=examples['location_id'],
+        desk_id=examples['desk_id'],
     )
-    print(response.text)
+    print_body(response.content)
 
 def saveDefaultSettings():
     # saveDefaultSettings
     settings_request = {
         'defaultSettingsRequest':{
-            'deskFloorID':configuration['examples']['floor_id'],
-            'roomLocationID':configuration['examples']['location_id'],
+            'deskFloorID':examples['floor_id'],
+            'roomLocationID':examples['location_id'],
             'roomGroupID':0,
             'deskForceDelete':1,
             'roomFloorID':'All',
-            'token':configuration['authentication']['sessionToken'],
-            'deskLocationID':configuration['examples']['location_id'],
-            'deskGroupID':configuration['examples']['group_id']
+            'token':authentication['sessionToken'],
+            'deskLocationID':examples['location_id'],
+            'deskGroupID':examples['group_id']
          }
     }
 
     response = condeco.saveDefaultSettings(
-        access_token=configuration['authentication']['token'],
+        access_token=authentication['token'],
         settings_request=settings_request
     )
-    print(response.text)
+    print_body(response.content)
 
 def search():
     # search
     response = condeco.search(
-        access_token=configuration['authentication']['token'],
-        session_token=configuration['authentication']['sessionToken'],
-        user_id=configuration['examples']['user_id'],
-        location_id=configuration['examples']['location_id'],
-        group_id=configuration['examples']['group_id'],
-        floor_id=configuration['examples']['floor_id'],
-        start_date=next_weekday(datetime.date.today(), 5).strftime('%d/%m/%Y'),
+        access_token=authentication['token'],
+        session_token=authentication['sessionToken'],
+        user_id=examples['user_id'],
+        location_id=examples['location_id'],
+        group_id=examples['group_id'],
+        floor_id=examples['floor_id'],
+        start_date=dates['next_saturday'],
         booking_type=Condeco.BOOKING_TYPE['AllDay'],
-        ws_type_id=configuration['examples']['ws_type_id']
+        ws_type_id=examples['ws_type_id']
     )
-    print(response.text)
+    print_body(response.content)
 
 def searchAllByRoomFeatures():
     # searchAllByRoomFeatures
@@ -308,83 +333,83 @@ def searchAllByRoomFeatures():
             'pageSize':50,
             'languageId':1,
             'pageIndex':1,
-            'startDate':(next_weekday(datetime.datetime.today(), 5) + datetime.timedelta(hours=17)).strftime('%Y-%m-%dT%H:%M:%SZ'),
-            'locationIds':[configuration['examples']['location_id']],
+            'startDate':dates['next_saturday_from'],
+            'locationIds':[examples['location_id']],
             'floorNums':[],
             'wsTypeID':Condeco.WORKSPACE_TYPE['Room'],
             'numberAttending':1,
             'groupIds':[],
             'roomAttributes':[],
-            'endDate':(next_weekday(datetime.datetime.today(), 5) + datetime.timedelta(minutes=5,hours=17)).strftime('%Y-%m-%dT%H:%M:%SZ'),
-            'token':configuration['authentication']['sessionToken']
+            'endDate':dates['next_saturday_to'],
+            'token':authentication['sessionToken']
         }
     }
 
     response = condeco.searchAllByRoomFeatures(
-        access_token=configuration['authentication']['token'],
+        access_token=authentication['token'],
         room_search_request_with_features=room_search_request_with_features
     )
-    print(response.text)
+    print_body(response.content)
 
 def searchDeskByFeatures():
     # searchDeskByFeatures
     desk_search_request_with_features = {
-        'accessToken':configuration['authentication']['sessionToken'],
-        'locationID':configuration['examples']['location_id'],
-        'groupID':configuration['examples']['group_id'],
-        'floorID':configuration['examples']['floor_id'],
+        'accessToken':authentication['sessionToken'],
+        'locationID':examples['location_id'],
+        'groupID':examples['group_id'],
+        'floorID':examples['floor_id'],
         'bookingType':Condeco.BOOKING_TYPE['None'],
-        'startDate':next_weekday(datetime.date.today(), 5).strftime('%d/%m/%Y'),
-        'userID':configuration['examples']['user_id'],
+        'startDate':dates['next_saturday'],
+        'userID':examples['user_id'],
         'deskAttributes':[],
-        'wsTypeID':configuration['examples']['ws_type_id']
+        'wsTypeID':examples['ws_type_id']
     }
 
     response = condeco.searchDeskByFeatures(
-        access_token=configuration['authentication']['token'],
+        access_token=authentication['token'],
         desk_search_request_with_features=desk_search_request_with_features
     )
-    print(response.text)
+    print_body(response.content)
 
 def teamMemberOperation():
     # teamMemberOperation
     team_member_operation_request = {
         'teamMemberOperation':{
-            'SessionGuid':configuration['authentication']['sessionToken'],
-            'MemberIds': [configuration['examples']['user_id_other_2']],
+            'SessionGuid':authentication['sessionToken'],
+            'MemberIds': [examples['user_id_other_2']],
             'ActionType':Condeco.ACTION_TYPE['Add']
         }
     }
 
     response = condeco.teamMemberOperation(
-        access_token=configuration['authentication']['token'],
+        access_token=authentication['token'],
         team_member_operation_request=team_member_operation_request
     )
-    print(response.text)
+    print_body(response.content)
 
 def updateAttendanceRecord():
     # updateAttendanceRecord
     response = condeco.updateAttendanceRecord(
-        access_token=configuration['authentication']['token'],
-        session_token=configuration['authentication']['sessionToken'],
-        start_date=next_weekday(datetime.date.today(), 5).strftime('%d/%m/%Y') + 'T00:00:00',
-        end_date=next_weekday(datetime.date.today(), 5).strftime('%d/%m/%Y') + 'T00:00:00',
+        access_token=authentication['token'],
+        session_token=authentication['sessionToken'],
+        start_date=dates['next_saturday'] + 'T00:00:00',
+        end_date=dates['next_saturday'] + 'T00:00:00',
         attendance_type=Condeco.ATTENDANCE_TYPE['OnLeave'],
         location_id=-1
     )
-    print(response.text)
+    print_body(response.content)
 
 def updateBooking():
     # updateBooking
     update_booking_request = {
-        'token':configuration['authentication']['sessionToken'],
-        'sessionGuid':configuration['authentication']['sessionToken'],
-        'UserID':configuration['authentication']['sessionToken'],
+        'token':authentication['sessionToken'],
+        'sessionGuid':authentication['sessionToken'],
+        'UserID':authentication['sessionToken'],
         'bookingRequest':{
             'NumAttending':1,
             'LanguageID':1,
-            'BookingID':configuration['examples']['room_booking_id'],
-            'RoomID':configuration['examples']['room_id'],
+            'BookingID':examples['room_booking_id'],
+            'RoomID':examples['room_id'],
             'MeetingTitle':'Meeting Title',
             'TimeTo':'/Date(1706032800000)/',
             'TimeFrom':'/Date(1706031000000)\/',
@@ -393,10 +418,10 @@ def updateBooking():
     }
 
     response = condeco.updateBooking(
-        access_token=configuration['authentication']['token'],
+        access_token=authentication['token'],
         update_booking_request=update_booking_request
     )
-    print(response.text)
+    print_body(response.content)
 
 #endregion
 
@@ -409,6 +434,95 @@ def next_weekday(date, weekday):
 
     return date + datetime.timedelta(days_ahead)
 
+def print_body(body):
+    # The body is only being displayed so it is written as-is (rather than first being decoded to a str).
+    sys.stdout.flush()
+    sys.stdout.buffer.write(body)
+    sys.stdout.buffer.write(b'\n')
+    sys.stdout.buffer.flush()
+
+async def readOnlyExamples():
+    # Each example spends nearly all of its time waiting on the network, so sending them all at once
+    # means the total wait is roughly that of the slowest one.
+    # (the asynchronous client is only imported here, so the other examples do not need aiohttp).
+    from hybrid_worker.condeco_async import AsyncCondeco
+
+    async with AsyncCondeco(unique_key=authentication['unique_key']) as async_condeco:
+        responses = await asyncio.gather(
+            async_condeco.deskGlobalSettings(),
+            async_condeco.deskSystemInfo(),
+            async_condeco.globalSettings(),
+            async_condeco.getSessionToken(access_token=authentication['token']),
+            async_condeco.getMyTeams(access_token=authentication['token'], user_long_id=authentication['sessionToken']),
+            async_condeco.getLoginInformation(
+                access_token=authentication['token'],
+                session_token=authentication['sessionToken'],
+                language_id=1,
+                current_date_time=dates['today'],
+                current_culture='en-GB'
+            ),
+            async_condeco.listBookings(
+                access_token=authentication['token'],
+                session_token=authentication['sessionToken'],
+                language_id=1,
+                desk_start_date=dates['today'],
+                desk_end_date=dates['next_week'],
+                room_start_date=dates['today'],
+                time_zone_id=2,
+                page_index=0,
+                page_size=50
+            ),
+            async_condeco.getAttendancesRecord(
+                access_token=authentication['token'],
+                session_token=authentication['sessionToken'],
+                start_date=dates['today'],
+                end_date=dates['next_fortnight'],
+                user_id=-1
+            ),
+
+            # One failing example should not prevent the others being displayed.
+            return_exceptions=True
+        )
+
+    # Display each of the responses in turn.
+    for response in responses:
+        if isinstance(response, Exception):
+            print(repr(response))
+        else:
+            print_body(await response.read())
+
+# The examples that can be selected on the command line (by name).
+EXAMPLES = {
+    'bookDesk': bookDesk,
+    'cancelBooking': cancelBooking,
+    'createBooking': createBooking,
+    'deleteBooking': deleteBooking,
+    'deskGlobalSettings': deskGlobalSettings,
+    'deskSystemInfo': deskSystemInfo,
+    'findColleagues': findColleagues,
+    'getAttendancesRecord': getAttendancesRecord,
+    'getColleagueBookings': getColleagueBookings,
+    'getDeskSessionToken': getDeskSessionToken,
+    'getFloorPlan': getFloorPlan,
+    'getGroupSettingsWithRestrictions': getGroupSettingsWithRestrictions,
+    'getLoginInformation': getLoginInformation,
+    'getMyTeams': getMyTeams,
+    'getRoomAvailabilities': getRoomAvailabilities,
+    'getRoomInfos': getRoomInfos,
+    'getSessionToken': getSessionToken,
+    'globalSettings': globalSettings,
+    'listBookings': listBookings,
+    'releaseDesk': releaseDesk,
+    'saveDefaultSettings': saveDefaultSettings,
+    'search': search,
+    'searchAllByRoomFeatures': searchAllByRoomFeatures,
+    'searchDeskByFeatures': searchDeskByFeatures,
+    'teamMemberOperation': teamMemberOperation,
+    'updateAttendanceRecord': updateAttendanceRecord,
+    'updateBooking': updateBooking,
+    'readOnlyExamples': lambda: asyncio.run(readOnlyExamples())
+}
+
 def main():
     """
     Main function for displaying Condeco® software interaction.
@@ -420,76 +534,137 @@ def main():
         None
     """
 
+    # Parse the command line arguments.
+    parser = argparse.ArgumentParser(description='Interact with the Condeco® software.')
+    parser.add_argument('--refresh', action='store_true', help='discard any cached responses first')
+    parser.add_argument('example', nargs='*', help='the examples to run (in order)')
+    arguments = parser.parse_args()
+
+    # Reject any examples that do not exist (before anything is sent).
+    for example_name in arguments.example:
+        if example_name not in EXAMPLES:
+            parser.error(f'unknown example "{example_name}" (choose from {", ".join(EXAMPLES)})')
+
     # Load configuration.
-    with open('configuration.json', mode='r', encoding='utf-8') as json_file:
+    with open('configuration.json', mode='rb') as json_file:
         global configuration
-        configuration = json.load(json_file)
+        configuration = serialisation.loads(json_file.read())
+
+    # Cache responses if available (this has to be installed before the Condeco® object creates its session).
+    if requests_cache:
+        requests_cache.install_cache(
+            cache_name=os.path.join(os.path.expanduser('~'), '.cache', 'hybrid_worker', 'condeco_cache'),
+            backend='sqlite',
+            expire_after=requests_cache.DO_NOT_CACHE,
+            urls_expire_after=CACHE_EXPIRY,
+
+            # The server's Cache-Control headers must not cause any other URL to be cached.
+            cache_control=False
+        )
+
+        # Discard any stale responses if requested.
+        if arguments.refresh:
+            requests_cache.clear()
 
     # Create an initialised Condeco® object.
     global condeco
     condeco = Condeco(unique_key=configuration['authentication']['unique_key'])
 
-    # Do we already have a token to use the app?
-    if configuration['authentication'].get('token'):
-
-        # bookDesk()
-        ## bookReservedTeamDayDesk()
-        # cancelBooking()
-        ## checkIn()
-        # createBooking()
-        ## createMyTeamDay()
-        # deleteBooking()
-        ## deleteTeamDay()
-        ## deskAuthenticateUserSecure()
-        # deskGlobalSettings()
-        # deskSystemInfo()
-        ## endBooking()
-        ## extendBooking()
-        # findColleagues()
-        ## geoFencingCheckIn()
-        # getAttendancesRecord()
-        # getColleagueBookings()
-        # getDeskSessionToken()
-        # getFloorPlan()
-        # getGroupSettingsWithRestrictions()
-        # getLoginInformation()
-        # getMyTeams()
-        ## getReservedDeskStatus()
-        # getRoomAvailabilities()
-        # getRoomInfos()
-        ## getSelfCertificationContent()
-        ## getSelfCertificationStatus()
-        # getSessionToken()
-        # globalSettings()
-        # listBookings()
-        # releaseDesk()
-        ## roomSearch()
-        ## roomSearchByFeatures()
-        # saveDefaultSettings()
-        # search()
-        # searchAllByRoomFeatures()
-        # searchDeskByFeatures()
-        ## selfCertifyUser()
-        ## startBooking()
-        ## teamDayAcceptDecline()
-        # teamMemberOperation()
-        # updateAttendanceRecord()
-        # updateBooking()
-        ## updateDefaultSettings()
-
-    # Is the user wanting to validate a validation key?
-    elif configuration['authentication'].get('validation_key'):
-        # Validate the validation key and return a token.
-        response = condeco.loginWithMagicLink(
-            validation_key=configuration['authentication']['validation_key']
-        )
-        print(response.text)
-    else:
-        # Send a validation key to this user.
-        response = condeco.sendMagicLink(
-            email=configuration['authentication']['email']
-        )
-        print(response.text)
+    # The user needs to authenticate first if there is no token to use the app.
+    if not configuration['authentication'].get('token'):
+        # Is the user wanting to validate a validation key?
+        if configuration['authentication'].get('validation_key'):
+            # Validate the validation key and return a token.
+            response = condeco.loginWithMagicLink(
+                validation_key=configuration['authentication']['validation_key']
+            )
+            print_body(response.content)
+        else:
+            # Send a validation key to this user.
+            response = condeco.sendMagicLink(
+                email=configuration['authentication']['email']
+            )
+            print_body(response.content)
+
+        return
+
+    # The examples read these sections frequently.
+    global authentication, examples
+    authentication = configuration['authentication']
+    examples = configuration['examples']
+
+    # The examples use these dates frequently (so they are only calculated and formatted once).
+    global dates
+    today = datetime.date.today()
+    midnight_today = datetime.datetime.combine(today, datetime.datetime.min.time())
+    dates = {
+        'today': today.strftime('%d/%m/%Y'),
+        'next_week': (today + datetime.timedelta(7)).strftime('%d/%m/%Y'),
+        'next_fortnight': (today + datetime.timedelta(14)).strftime('%d/%m/%Y'),
+        'next_saturday': next_weekday(today, 5).strftime('%d/%m/%Y'),
+
+        # Rooms are searched for from 17:00 to 17:05 next Saturday (in ISO 8601 format).
+        'next_saturday_from': (next_weekday(midnight_today, 5) + datetime.timedelta(hours=17)).isoformat(timespec='seconds') + 'Z',
+        'next_saturday_to': (next_weekday(midnight_today, 5) + datetime.timedelta(minutes=5, hours=17)).isoformat(timespec='seconds') + 'Z',
+
+        # Meetings are from 17:00 to 17:15 today (in milliseconds since the epoch).
+        'meeting_from': f'/Date({int((midnight_today + datetime.timedelta(hours=17)).timestamp() * 1000)})/',
+        'meeting_to': f'/Date({int((midnight_today + datetime.timedelta(hours=17, minutes=15)).timestamp() * 1000)})/'
+    }
+
+    # Run any examples named on the command line.
+    for example_name in arguments.example:
+        EXAMPLES[example_name]()
+
+    # Alternatively uncomment any of the following examples to run them.
+    # bookDesk()
+    ## bookReservedTeamDayDesk()
+    # cancelBooking()
+    ## checkIn()
+    # createBooking()
+    ## createMyTeamDay()
+    # deleteBooking()
+    ## deleteTeamDay()
+    ## deskAuthenticateUserSecure()
+    # deskGlobalSettings()
+    # deskSystemInfo()
+    ## endBooking()
+    ## extendBooking()
+    # findColleagues()
+    ## geoFencingCheckIn()
+    # getAttendancesRecord()
+    # getColleagueBookings()
+    # getDeskSessionToken()
+    # getFloorPlan()
+    # getGroupSettingsWithRestrictions()
+    # getLoginInformation()
+    # getMyTeams()
+    ## getReservedDeskStatus()
+    # getRoomAvailabilities()
+    # getRoomInfos()
+    ## getSelfCertificationContent()
+    ## getSelfCertificationStatus()
+    # getSessionToken()
+    # globalSettings()
+    # listBookings()
+    # releaseDesk()
+    ## roomSearch()
+    ## roomSearchByFeatures()
+    # saveDefaultSettings()
+    # search()
+    # searchAllByRoomFeatures()
+    # searchDeskByFeatures()
+    ## selfCertifyUser()
+    ## startBooking()
+    ## teamDayAcceptDecline()
+    # teamMemberOperation()
+    # updateAttendanceRecord()
+    # updateBooking()
+    ## updateDefaultSettings()
+
+    # The read-only examples do not depend on each other so can instead be run at the same time
+    # (any examples that change bookings should still be run one after another, afterwards).
+    # asyncio.run(readOnlyExamples())
 
 # Launch the main method if invoked directly.
 if __name__ == '__main__':
@@ -22,19 +22,173 @@ This module provides classes and methods for interacting with the Condeco® soft
 It supports obtaining an authenticated session and querying the system.
 """
 
-# We reject cookies.
+# We send batches of requests concurrently.
+import concurrent.futures
+
+# We can bind tokens for the duration of a block.
+import contextlib
+
+# We cache decoded tokens.
+import functools
+
+# We discard cookies.
 import http.cookiejar
 
+# We find which methods take tokens.
+import inspect
+
 # We can check JWT claims/expiration first before making a request
 # ("pip install pyjwt" if not already installed).
 import jwt
 
-# Third party library for making HTTP(S) requests;
-# "pip install requests" if getting import errors.
-import requests
+# We check cached tokens have not since expired.
+import time
+
+# We share read-only headers.
+import types
+
+# We encode JSON request bodies.
+from . import serialisation
+
+
+def cached(ttl):
+    """
+    Re-use a method's successful response when it is called again with the same arguments.
+
+    The same decorator serves Condeco and AsyncCondeco (whose calls are awaited).
+
+    Args:
+        ttl (int): The number of seconds a response is re-used for.
+
+    Returns:
+        function: The decorator.
+    """
+
+    def decorator(method):
+        # The arguments are matched to the method's parameters (so it does not matter how they were passed).
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            # The response depends on the method and every argument it was called with.
+            arguments = signature.bind(self, *args, **kwargs).arguments
+            key = (method.__name__, tuple(item for item in arguments.items() if item[0] != 'self'))
+
+            # AsyncCondeco's responses have to be awaited (so the caller is returned a coroutine instead).
+            if inspect.iscoroutinefunction(self._request):
+                async def send():
+                    # Re-use the response if it has not yet expired, otherwise send the request.
+                    response = _cached_response(self, key, arguments)
+                    if response is None:
+                        response = _cache_response(self.response_cache, key, ttl, await method(self, *args, **kwargs))
+                    return response
+
+                return send()
+
+            # Re-use the response if it has not yet expired, otherwise send the request.
+            response = _cached_response(self, key, arguments)
+            if response is None:
+                response = _cache_response(self.response_cache, key, ttl, method(self, *args, **kwargs))
+            return response
+
+        return wrapper
+
+    return decorator
+
+def _cached_response(instance, key, arguments):
+    # An expired token is still rejected (like every other method) even if a response for it is cached.
+    if 'access_token' in arguments:
+        Condeco.authorisation_headers(arguments['access_token'])
+
+    # The response (if it has not yet expired).
+    entry = instance.response_cache.get(key)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+
+    return None
+
+def _cache_response(response_cache, key, ttl, response):
+    # Only successful responses are worth re-using.
+    if _status_code(response) == 200:
+        now = time.monotonic()
+
+        # Responses cached for tokens that have since been replaced would otherwise accumulate.
+        for expired_key in [cached_key for cached_key, (expiry, _) in response_cache.items() if expiry <= now]:
+            del response_cache[expired_key]
+
+        response_cache[key] = (now + ttl, response)
+
+    # Return the response.
+    return response
 
-# We implement urllib3 retries.
-import urllib3.util
+
+def _status_code(response):
+    # aiohttp calls the status code "status".
+    return getattr(response, 'status_code', None) or response.status
+
+
+class DummyCookieJar(http.cookiejar.CookieJar):
+    """
+    A cookie jar that never stores any cookies (like aiohttp's DummyCookieJar).
+    """
+
+    def extract_cookies(self, response, request):
+        # The cookies in a response are ignored without even being parsed.
+        pass
+
+    def set_cookie(self, cookie):
+        # Nor can any cookie be added.
+        pass
+
+
+class AuthenticatedCondeco:
+    """
+    A view of a Condeco (or AsyncCondeco) instance whose methods no longer need to be passed the tokens.
+    """
+
+    __slots__ = ('condeco', 'access_token', 'session_token', 'methods')
+
+    # Parameterized constructor.
+    def __init__(self, condeco, access_token, session_token=None):
+        """
+        Initalise the AuthenticatedCondeco class.
+
+        Args:
+            condeco (Condeco or AsyncCondeco): The instance to send the requests with.
+            access_token (str): The access token to pass to each method.
+            session_token (str, optional): The session token to pass to each method that takes one.
+        """
+
+        self.condeco = condeco
+        self.access_token = access_token
+        self.session_token = session_token
+
+        # Each bound method is only built once.
+        self.methods = {}
+
+    def __getattr__(self, name):
+        # Re-use the method if it has already been bound.
+        method = self.methods.get(name)
+        if method:
+            return method
+
+        # Anything that is not a method (or does not take the tokens) is returned unchanged.
+        method = getattr(self.condeco, name)
+        if not callable(method):
+            return method
+        parameters = list(inspect.signature(method).parameters)
+        if parameters[:1] != ['access_token']:
+            return method
+
+        # The tokens are always the first arguments (without a session token the caller still passes their own).
+        if parameters[1:2] == ['session_token'] and self.session_token is not None:
+            method = functools.partial(method, self.access_token, self.session_token)
+        else:
+            method = functools.partial(method, self.access_token)
+
+        # Store and return the bound method.
+        self.methods[name] = method
+        return method
 
 
 class Condeco:
@@ -42,12 +196,36 @@ class Condeco:
     A class to talk to Condeco®'s Cloud based software.
     """
 
-    # This creates an expected user-agent and encourages JSON responses.
-    HEADERS = {'User-Agent': 'okhttp/4.10.0', 'Accept': 'application/json'}
+    # Instances only ever have these attributes (so no per-instance dictionary is needed).
+    __slots__ = ('unique_key', 'base_url', 'response_cache', 'global_settings_response', 'session')
+
+    # This creates an expected user-agent and encourages JSON responses
+    # (read-only, as the sessions take their own copy).
+    HEADERS = types.MappingProxyType({'User-Agent': 'okhttp/4.10.0', 'Accept': 'application/json'})
+
+    # Requests with a body also declare it as JSON (as the body is encoded before being sent).
+    JSON_HEADERS = types.MappingProxyType({'Content-Type': 'application/json'})
 
     # This sets a 5 second connect and 8 second read timeout.
     TIMEOUT = (5, 8)
 
+    # The searches and lists can take the server longer to answer (so they get a 30 second read timeout).
+    SEARCH_TIMEOUT = (5, 30)
+
+    # A token is only treated as expired this many seconds after its expiry (in case this clock is slightly ahead of the server's).
+    TOKEN_LEEWAY = 30
+
+    # The GET requests that change bookings or settings (so they must not be sent again once they have reached the server).
+    MUTATING_GET_PATHS = (
+        '/MobileAPI/DeskBookingService.svc/Book',
+        '/MobileAPI/DeskBookingService.svc/CheckIn',
+        '/MobileAPI/DeskBookingService.svc/Delete',
+        '/MobileAPI/DeskBookingService.svc/GeoFencingCheckIn',
+        '/MobileAPI/DeskBookingService.svc/Release',
+        '/MobileAPI/DeskBookingService.svc/SaveDefaultSettings',
+        '/MobileAPI/DeskBookingService.svc/UpdateAttendanceRecord'
+    )
+
     ACTION_TYPE = {
         'Add': 0,
         'Remove': 1
@@ -94,29 +272,245 @@ class Condeco:
     }
 
     # Parameterized constructor.
-    def __init__(self, unique_key):
+    def __init__(self, unique_key, use_http2=False, max_concurrency=8):
         """
         Initalise the Condeco class with a unique_key.
 
         Args:
             unique_key (str): The hostname of the Condeco instance.
+            use_http2 (bool, optional): Whether to multiplex requests over HTTP/2 (this requires httpx).
+            max_concurrency (int, optional): The maximum number of requests in flight at once (so how many connections are kept open).
         """
 
         # The Condeco® instance to interact with.
         self.unique_key = unique_key
 
+        # Every request is sent to this instance (so the start of each URL is only built once).
+        self.base_url = f'https://{unique_key}'
+
+        # Responses from the rarely changing endpoints are re-used for a while (clear this to fetch them again).
+        self.response_cache = {}
+
+        # The last global settings response (so the settings are only downloaded again once they change).
+        self.global_settings_response = None
+
+        # HTTP/2 carries many requests over one connection (responses are then httpx.Response objects).
+        if use_http2:
+            # Third party library for making HTTP/2 requests;
+            # "pip install httpx[http2]" if getting import errors.
+            from .http2 import HTTP2Session
+
+            self.session = HTTP2Session(headers=Condeco.HEADERS, max_connections=max_concurrency)
+            return
+
+        # Third party library for making HTTP(S) requests (only imported when needed, as AsyncCondeco and
+        # HTTP/2 do not use it); "pip install requests" if getting import errors.
+        import requests
+
+        # We implement urllib3 retries (urllib3 is installed with Requests).
+        import urllib3.util
+
         # Using a Session means Requests supports keep-alives.
         self.session = requests.Session()
 
+        # The session sends these headers with every request.
+        self.session.headers.update(Condeco.HEADERS)
+
         # Retry a request multiple times (the data is generally stale after more than 3 retries).
-        max_retries = urllib3.util.Retry(total=3, allowed_methods=['GET','PUT','POST'])
-        self.session.mount('https://', requests.adapters.HTTPAdapter(max_retries=max_retries))
+        # A connection that could not be made is always retried (as nothing was sent), but only the read-only GET
+        # requests are retried after a partial response or an error status, as a gateway error or timeout can
+        # arrive after the server has already acted on a request (which would then be duplicated).
+        # (the retries wait a short, doubling delay (0, 0.6 and then 1.2 seconds), being rate limited waits for
+        # any Retry-After the server asks for and once the retries run out the last error response is returned).
+        max_retries = urllib3.util.Retry(
+            total=3,
+            connect=3,
+            read=2,
+            allowed_methods=['GET','HEAD'],
+            backoff_factor=0.3,
+            status_forcelist=[429,502,503,504],
+            raise_on_status=False
+        )
+
+        # Keep connections to the one host alive so back-to-back (or concurrent) requests skip the TCP and TLS handshakes.
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrency, max_retries=max_retries)
+        self.session.mount('https://', adapter)
+
+        # The GET requests that change something are only retried when the connection could not be made.
+        mutating_adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max_concurrency,
+            max_retries=urllib3.util.Retry(total=3, connect=3, read=0, status=0, other=0, backoff_factor=0.3, raise_on_status=False)
+        )
+
+        # Both adapters share the one pool of connections (only the retry policy differs).
+        mutating_adapter.poolmanager = adapter.poolmanager
+        for path in Condeco.MUTATING_GET_PATHS:
+            self.session.mount(f'{self.base_url}{path}', mutating_adapter)
 
         # Do not accept any cookies (especially ARRAffinity).
-        self.session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+        self.session.cookies = DummyCookieJar()
         
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Close the underlying session and any pooled connections.
+        """
+
+        self.session.close()
+
+    def warmup(self):
+        """
+        Open a connection before it is needed (so the first real request does not also wait for the TCP and TLS handshakes).
+
+        Returns:
+            Response: The full response object.
+        """
+
+        # A HEAD request of an unauthenticated endpoint leaves an open connection in the pool.
+        return self._request(
+            method='HEAD',
+            url=f'{self.base_url}/mobileapi/MobileService.svc/Configuration/GetGlobalSettings'
+        )
+
+    @contextlib.contextmanager
+    def authenticated(self, access_token, session_token=None):
+        """
+        Bind the tokens so the same pair need not be passed to many calls.
+
+        Args:
+            access_token (str): The access token to pass to each method.
+            session_token (str, optional): The session token to pass to each method that takes one.
+
+        Returns:
+            AuthenticatedCondeco: A view of this instance whose methods no longer take the tokens.
+        """
+
+        # The instance itself is left untouched (so it remains safe to use from other threads).
+        yield AuthenticatedCondeco(self, access_token, session_token)
+
+    def _request(self, method, url, headers=None, params=None, json=None, timeout=None, **kwargs):
+        """
+        Send a request to the Condeco® software.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL to request.
+            headers (dict, optional): Any headers to send in addition to the session headers.
+            params (dict, optional): The query parameters.
+            json (object, optional): The object to send as the JSON request body.
+            timeout (tuple, optional): The connect and read timeouts (in seconds) if not the usual TIMEOUT.
+            **kwargs: Any other arguments for the session (e.g. stream).
+
+        Returns:
+            Response: The full response object.
+        """
+
+        # Encode any JSON body ourselves (so the faster encoder is used when available).
+        if json is not None:
+            kwargs['data'] = serialisation.dumps(json)
+            headers = {**(headers or {}), **Condeco.JSON_HEADERS}
+
+        # Send the request.
+        return self.session.request(method=method, url=url, params=params, headers=headers, timeout=timeout or Condeco.TIMEOUT, **kwargs)
+
+    @staticmethod
+    def authorisation_headers(access_token):
+        """
+        Get the headers that authorise a request.
+
+        Args:
+            access_token (str): The JWT proving authorisation.
+
+        Returns:
+            Mapping: The Authorization header (read-only, as it is shared between calls).
+
+        Raises:
+            jwt.ExpiredSignatureError: If the token has already expired (so the server would only reject it).
+        """
+
+        # There is no point in sending a request the server is certain to reject.
+        expiry = Condeco._token_expiry(access_token)
+        if expiry is not None and expiry + Condeco.TOKEN_LEEWAY <= time.time():
+            raise jwt.ExpiredSignatureError('Signature has expired')
+
+        # We append an OAuth 2.0 bearer token.
+        return Condeco._bearer_headers(access_token)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _bearer_headers(token):
+        # The same token is sent with every call, so the header is built once and shared (read-only).
+        return types.MappingProxyType({'Authorization': f'Bearer {token}'})
+
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _token_expiry(token):
+        # Only the expiry is of interest here (the server still checks everything else).
+        try:
+            expiry = jwt.decode(jwt=token, options={'verify_signature': False, 'verify_exp': False}).get('exp')
+        except jwt.DecodeError:
+            return None
+
+        # An expiry that is not a number cannot be checked here (so is left for the server to judge).
+        if isinstance(expiry, bool) or not isinstance(expiry, (int, float)):
+            return None
+
+        return expiry
+
+    @staticmethod
+    def conditional_headers(response):
+        """
+        Get the headers that ask the server to only send a response again if it has changed.
+
+        Args:
+            response (Response or ClientResponse): The previous response.
+
+        Returns:
+            dict: The If-None-Match and If-Modified-Since headers (empty if the response cannot be revalidated).
+        """
+
+        headers = {}
+
+        # The server identifies this version of the response.
+        etag = response.headers.get('ETag')
+        if etag:
+            headers['If-None-Match'] = etag
+
+        # The server dated this version of the response.
+        last_modified = response.headers.get('Last-Modified')
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+        return headers
+
     @staticmethod
     def decode_jwt(token, audience=None):
+        # Check the (cached) expiry first: a cached payload may have expired since it was first validated,
+        # and as a failed validation is not cached an expired token would otherwise be fully decoded every time
+        # (an "exp" that is not a number is left for PyJWT to reject).
+        expiry = Condeco._token_expiry(token)
+        if expiry is not None and expiry <= time.time():
+            raise jwt.ExpiredSignatureError('Signature has expired')
+
+        # A list of audiences is converted to a tuple so it can be part of the cache key.
+        if audience is not None and not isinstance(audience, str):
+            audience = tuple(audience)
+
+        # The same token is typically decoded repeatedly, so the validated payload is cached.
+        payload = Condeco._decode_jwt(token, audience)
+
+        # Return a copy so the cached payload cannot be modified by the caller.
+        return payload.copy()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _decode_jwt(token, audience):
         # While the signature itself is not verified, we enforce required fields and validate
         # "iss", "exp", "iat" and "nbf" values.
         options = {
@@ -136,7 +530,7 @@ class Condeco:
         return jwt.decode(
             jwt=token,
             options=options,
-            audience=audience,
+            audience=list(audience) if isinstance(audience, tuple) else audience,
             issuer='CondecoPasswordless'
         )
 
@@ -158,11 +552,8 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Query parameters.
         params = {
@@ -176,16 +567,13 @@ class Condeco:
         }
 
         # Send the desk booking request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/MobileAPI/DeskBookingService.svc/Book',
+        return self._request(
+            method='GET',
+            url=f'{self.base_url}/MobileAPI/DeskBookingService.svc/Book',
             params=params,
-            headers=headers,
-            timeout=Condeco.TIMEOUT
+            headers=headers
         )
 
-        # Return the response.
-        return response
-
     def bookReservedTeamDayDesk(self, access_token, book_reserved_team_day_desk_request):
         """
         Book a reserved team day desk.
@@ -198,23 +586,17 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Send the team day desk booking request.
-        response = self.session.post(
-            url=f'https://{self.unique_key}/MobileAPI/MobileService.svc/team/BookReservedTeamDayDesk',
+        return self._request(
+            method='POST',
+            url=f'{self.base_url}/MobileAPI/MobileService.svc/team/BookReservedTeamDayDesk',
             headers=headers,
-            json=book_reserved_team_day_desk_request,
-            timeout=Condeco.TIMEOUT
+            json=book_reserved_team_day_desk_request
         )
 
-        # Return the response.
-        return response
-
     def cancelBooking(self, access_token, delete_booking):
         """
         Cancel a room booking.
@@ -227,23 +609,17 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Send the delete room booking request.
-        response = self.session.post(
-            url=f'https://{self.unique_key}/mobileapi/MobileService.svc/RoomBookings/DeleteRoomBookingWithBody',
+        return self._request(
+            method='POST',
+            url=f'{self.base_url}/mobileapi/MobileService.svc/RoomBookings/DeleteRoomBookingWithBody',
             headers=headers,
-            json=delete_booking,
-            timeout=Condeco.TIMEOUT
+            json=delete_booking
         )
 
-        # Return the response.
-        return response
-
     def checkIn(self, access_token, session_token, location_id, desk_id, qr_code):
         """
         Check in to a desk.
@@ -259,11 +635,8 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Query parameters.
         params = {
@@ -274,16 +647,13 @@ class Condeco:
         }
 
         # Send the desk check in request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/MobileAPI/DeskBookingService.svc/CheckIn',
+        return self._request(
+            method='GET',
+            url=f'{self.base_url}/MobileAPI/DeskBookingService.svc/CheckIn',
             params=params,
-            headers=headers,
-            timeout=Condeco.TIMEOUT
+            headers=headers
         )
 
-        # Return the response.
-        return response
-
     def createBooking(self, access_token, add_booking):
         """
         Create a room booking.
@@ -296,23 +666,17 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Send the create room booking request.
-        response = self.session.put(
-            url=f'https://{self.unique_key}/MobileAPI/MobileService.svc/RoomBookings/Add',
+        return self._request(
+            method='PUT',
+            url=f'{self.base_url}/MobileAPI/MobileService.svc/RoomBookings/Add',
             headers=headers,
-            json=add_booking,
-            timeout=Condeco.TIMEOUT
+            json=add_booking
         )
 
-        # Return the response.
-        return response
-
     def createMyTeamDay(self, access_token, create_team_day_request):
         """
         Create a team day.
@@ -325,23 +689,17 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Send the create team day request.
-        response = self.session.post(
-            url=f'https://{self.unique_key}/MobileAPI/MobileService.svc/team/CreateMyTeamDay',
+        return self._request(
+            method='POST',
+            url=f'{self.base_url}/MobileAPI/MobileService.svc/team/CreateMyTeamDay',
             headers=headers,
-            json=create_team_day_request,
-            timeout=Condeco.TIMEOUT
+            json=create_team_day_request
         )
 
-        # Return the response.
-        return response
-
     def deleteBooking(self, access_token, session_token, booking_id, desk_id, start_date, end_date, booking_type):
         """
         Delete a desk booking.
@@ -359,11 +717,8 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Query parameters.
         params = {
@@ -376,16 +731,13 @@ class Condeco:
         }
 
         # Send the delete desk booking request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/MobileAPI/DeskBookingService.svc/Delete',
+        return self._request(
+            method='GET',
+            url=f'{self.base_url}/MobileAPI/DeskBookingService.svc/Delete',
             params=params,
-            headers=headers,
-            timeout=Condeco.TIMEOUT
+            headers=headers
         )
 
-        # Return the response.
-        return response
-
     def deleteTeamDay(self, access_token, delete_team_day):
         """
         Cancel a team day.
@@ -398,23 +750,17 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Send the cancel team day request.
-        response = self.session.post(
-            url=f'https://{self.unique_key}/MobileAPI/MobileService.svc/team/CancelTeamDay',
+        return self._request(
+            method='POST',
+            url=f'{self.base_url}/MobileAPI/MobileService.svc/team/CancelTeamDay',
             headers=headers,
-            json=delete_team_day,
-            timeout=Condeco.TIMEOUT
+            json=delete_team_day
         )
 
-        # Return the response.
-        return response
-
     def deskAuthenticateUserSecure(self, user_authentication):
         """
         Start the desk authentication process with Condeco®.
@@ -427,16 +773,13 @@ class Condeco:
         """
 
         # Send the desk authentication request.
-        response = self.session.post(
-            url=f'https://{self.unique_key}/LoginAPI/auth/authenticateusersecure',
-            headers=Condeco.HEADERS,
-            json=user_authentication,
-            timeout=Condeco.TIMEOUT
+        return self._request(
+            method='POST',
+            url=f'{self.base_url}/LoginAPI/auth/authenticateusersecure',
+            json=user_authentication
         )
 
-        # Return the response.
-        return response
-
+    @cached(ttl=600)
     def deskGlobalSettings(self):
         """
         Get the global settings.
@@ -446,15 +789,12 @@ class Condeco:
         """
 
         # Send the global settings request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/MobileAPI/DeskBookingService.svc/Configuration/GetGlobalSettings',
-            headers=Condeco.HEADERS,
-            timeout=Condeco.TIMEOUT
+        return self._request(
+            method='GET',
+            url=f'{self.base_url}/MobileAPI/DeskBookingService.svc/Configuration/GetGlobalSettings'
         )
 
-        # Return the response.
-        return response
-
+    @cached(ttl=600)
     def deskSystemInfo(self):
         """
         Get the desk system information.
@@ -464,15 +804,11 @@ class Condeco:
         """
 
         # Send the system information request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/api/systeminfo',
-            headers=Condeco.HEADERS,
-            timeout=Condeco.TIMEOUT
+        return self._request(
+            method='GET',
+            url=f'{self.base_url}/api/systeminfo'
         )
 
-        # Return the response.
-        return response
-
     def endBooking(self, access_token, end_booking_request):
         """
         End a room booking.
@@ -485,23 +821,17 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Send the end room booking request.
-        response = self.session.put(
-            url=f'https://{self.unique_key}/MobileAPI/MobileService.svc/RoomBookings/End',
+        return self._request(
+            method='PUT',
+            url=f'{self.base_url}/MobileAPI/MobileService.svc/RoomBookings/End',
             headers=headers,
-            json=end_booking_request,
-            timeout=Condeco.TIMEOUT
+            json=end_booking_request
         )
 
-        # Return the response.
-        return response
-
     def extendBooking(self, access_token, extend_booking_request):
         """
         End a room booking.
@@ -514,23 +844,17 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Send the extend room booking request.
-        response = self.session.put(
-            url=f'https://{self.unique_key}/MobileAPI/MobileService.svc/RoomBookings/Extend',
+        return self._request(
+            method='PUT',
+            url=f'{self.base_url}/MobileAPI/MobileService.svc/RoomBookings/Extend',
             headers=headers,
-            json=extend_booking_request,
-            timeout=Condeco.TIMEOUT
+            json=extend_booking_request
         )
 
-        # Return the response.
-        return response
-
     def findColleagues(self, access_token, session_token, name):
         """
         Find colleagues.
@@ -544,11 +868,8 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Query parameters.
         params = {
@@ -557,16 +878,13 @@ class Condeco:
         }
 
         # Send the find colleagues request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/MobileAPI/DeskBookingService.svc/FindColleague',
+        return self._request(
+            method='GET',
+            url=f'{self.base_url}/MobileAPI/DeskBookingService.svc/FindColleague',
             params=params,
-            headers=headers,
-            timeout=Condeco.TIMEOUT
+            headers=headers
         )
 
-        # Return the response.
-        return response
-
     def geoFencingCheckIn(self, access_token, session_token, locations):
         """
         Geofence check in.
@@ -580,11 +898,8 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Query parameters.
         params = {
@@ -593,16 +908,13 @@ class Condeco:
         }
 
         # Send the geofence check in request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/MobileAPI/DeskBookingService.svc/GeoFencingCheckIn',
+        return self._request(
+            method='GET',
+            url=f'{self.base_url}/MobileAPI/DeskBookingService.svc/GeoFencingCheckIn',
             params=params,
-            headers=headers,
-            timeout=Condeco.TIMEOUT
+            headers=headers
         )
 
-        # Return the response.
-        return response
-
     def getAttendancesRecord(self, access_token, session_token, start_date, end_date, user_id):
         """
         Get attendance record for a user.
@@ -617,11 +929,8 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Query parameters.
         params = {
@@ -632,17 +941,14 @@ class Condeco:
         }
 
         # Send the attendance record request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/MobileAPI/DeskBookingService.svc/GetAttendanceRecord',
+        return self._request(
+            method='GET',
+            url=f'{self.base_url}/MobileAPI/DeskBookingService.svc/GetAttendanceRecord',
             params=params,
-            headers=headers,
-            timeout=Condeco.TIMEOUT
+            headers=headers
         )
 
-        # Return the response.
-        return response
-
-    def getColleagueBookings(self, access_token, session_token, start_date, end_date, time_zone_id, user_id):
+    def getColleagueBookings(self, access_token, session_token, start_date, end_date, time_zone_id, user_id, stream=False):
         """
         Get colleague booking records for a user.
 
@@ -653,16 +959,14 @@ class Condeco:
             end_date (str): The end date to find booking information for.
             time_zone_id (str): The time zone.
             user_id (int): The user identification number to find booking information for.
+            stream (bool, optional): Whether to defer downloading the body (so it can be parsed incrementally with serialisation.iter_items, the HTTP/2 session and AsyncCondeco always download it first).
 
         Returns:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Query parameters.
         params = {
@@ -674,16 +978,14 @@ class Condeco:
         }
 
         # Send the colleague bookings request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/MobileAPI/DeskBookingService.svc/UserBookings',
+        return self._request(
+            method='GET',
+            url=f'{self.base_url}/MobileAPI/DeskBookingService.svc/UserBookings',
             params=params,
             headers=headers,
-            timeout=Condeco.TIMEOUT
+            stream=stream
         )
 
-        # Return the response.
-        return response
-
     def getDeskSessionToken(self, access_token, current_culture=None):
         """
         Get desk booking session token.
@@ -696,11 +998,8 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Query parameters.
         if current_culture is not None:
@@ -709,17 +1008,14 @@ class Condeco:
             params = None
 
         # Send the desk booking session token request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/mobileapi/MobileService.svc/User/GetSessionTokenV2',
+        return self._request(
+            method='GET',
+            url=f'{self.base_url}/mobileapi/MobileService.svc/User/GetSessionTokenV2',
             params=params,
-            headers=headers,
-            timeout=Condeco.TIMEOUT
+            headers=headers
         )
 
-        # Return the response.
-        return response
-
-    def getFloorPlan(self, access_token, session_token, location_id, group_id, floor_id):
+    def getFloorPlan(self, access_token, session_token, location_id, group_id, floor_id, stream=False):
         """
         Get floor plan.
 
@@ -729,16 +1025,14 @@ class Condeco:
             location_id (int): The specified location identifier.
             group_id (int): The specified group identifier.
             floor_id (int): The specified floor identifier.
+            stream (bool, optional): Whether to defer downloading the body (so it can be parsed incrementally with serialisation.iter_items, the HTTP/2 session and AsyncCondeco always download it first).
 
         Returns:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Query parameters.
         params = {
@@ -749,19 +1043,49 @@ class Condeco:
         }
 
         # Send the floor plan request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/MobileAPI/DeskBookingService.svc/floors/Floorplan',
+        return self._request(
+            method='GET',
+            url=f'{self.base_url}/MobileAPI/DeskBookingService.svc/floors/Floorplan',
             params=params,
             headers=headers,
-            timeout=Condeco.TIMEOUT
+            stream=stream
         )
 
-        # Return the response.
-        return response
+    def getFloorPlanBatch(self, access_token, session_token, location_id, group_id, floor_ids, max_workers=8):
+        """
+        Get the floor plans for several floors at the same time.
+
+        Args:
+            access_token (str): The JWT proving authorisation.
+            session_token (str): The opaque session access token.
+            location_id (int): The location the floors are in.
+            group_id (int): The group the floors are in.
+            floor_ids (list of int): The floor identification numbers (a floor listed more than once is only requested once).
+            max_workers (int, optional): The maximum number of requests in flight at once (at most the max_concurrency the client was created with).
+
+        Returns:
+            list of Response: The full response objects (in the same order as floor_ids).
+        """
+
+        # Send each distinct floor plan request at once (the session is safe to share between threads).
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                floor_id: executor.submit(
+                    self.getFloorPlan,
+                    access_token=access_token,
+                    session_token=session_token,
+                    location_id=location_id,
+                    group_id=group_id,
+                    floor_id=floor_id
+                ) for floor_id in dict.fromkeys(floor_ids)
+            }
+
+        # Return each of the responses (raising any exception a request raised).
+        return [futures[floor_id].result() for floor_id in floor_ids]
 
     def getGroupSettingsWithRestrictions(self, access_token, session_token, booking_for_user_id, location_id, group_ids):
         """
-        Get floor plan.
+        Get the group settings (including any booking restrictions).
 
         Args:
             access_token (str): The JWT proving authorisation.
@@ -774,11 +1098,8 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Query parameters.
         params = {
@@ -788,17 +1109,14 @@ class Condeco:
             'groupIds': group_ids
         }
 
-        # Send the desk booking session token request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/MobileAPI/DeskBookingService.svc/groupSettingsWithRestrictions',
+        # Send the group settings request.
+        return self._request(
+            method='GET',
+            url=f'{self.base_url}/MobileAPI/DeskBookingService.svc/groupSettingsWithRestrictions',
             params=params,
-            headers=headers,
-            timeout=Condeco.TIMEOUT
+            headers=headers
         )
 
-        # Return the response.
-        return response
-
     def getLoginInformation(self, access_token, session_token, language_id, current_date_time, current_culture):
         """
         Get login information.
@@ -814,11 +1132,8 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Query parameters.
         params = {
@@ -829,16 +1144,14 @@ class Condeco:
         }
 
         # Send the login information request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/MobileAPI/MobileService.svc/User/LoginInformationsV2',
+        return self._request(
+            method='GET',
+            url=f'{self.base_url}/MobileAPI/MobileService.svc/User/LoginInformationsV2',
             params=params,
-            headers=headers,
-            timeout=Condeco.TIMEOUT
+            headers=headers
         )
 
-        # Return the response.
-        return response
-
+    @cached(ttl=300)
     def getMyTeams(self, access_token, user_long_id):
         """
         Get team information.
@@ -851,26 +1164,20 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Query parameters.
         params = {'userlongId': user_long_id}
 
         # Send the team request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/MobileAPI/MobileService.svc/team/GetMyTeams',
+        return self._request(
+            method='GET',
+            url=f'{self.base_url}/MobileAPI/MobileService.svc/team/GetMyTeams',
             params=params,
-            headers=headers,
-            timeout=Condeco.TIMEOUT
+            headers=headers
         )
 
-        # Return the response.
-        return response
-
     def getReservedDeskStatus(self, access_token, user_long_id, team_day_id):
         """
         Get reserved desk status information.
@@ -884,11 +1191,8 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Query parameters.
         params = {
@@ -897,74 +1201,65 @@ class Condeco:
         }
 
         # Send the reserved desk status request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/MobileAPI/MobileService.svc/team/GetReservedDeskStatus',
+        return self._request(
+            method='GET',
+            url=f'{self.base_url}/MobileAPI/MobileService.svc/team/GetReservedDeskStatus',
             params=params,
-            headers=headers,
-            timeout=Condeco.TIMEOUT
+            headers=headers
         )
 
-        # Return the response.
-        return response
-
-    def getRoomAvailabilities(self, access_token, room_request):
+    def getRoomAvailabilities(self, access_token, room_request, stream=False):
         """
         Get room availability information.
 
         Args:
             access_token (str): The JWT proving authorisation.
             room_request (str): The room request.
+            stream (bool, optional): Whether to defer downloading the body (so it can be parsed incrementally with serialisation.iter_items, the HTTP/2 session and AsyncCondeco always download it first).
 
         Returns:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Send the room availabilities request.
-        response = self.session.post(
-            url=f'https://{self.unique_key}/MobileAPI/MobileService.svc/RoomBookings/RoomAvailability',
+        return self._request(
+            method='POST',
+            url=f'{self.base_url}/MobileAPI/MobileService.svc/RoomBookings/RoomAvailability',
             headers=headers,
             json=room_request,
-            timeout=Condeco.TIMEOUT
+            stream=stream,
+            timeout=self.SEARCH_TIMEOUT
         )
 
-        # Return the response.
-        return response
-
-    def getRoomInfos(self, access_token, room_request):
+    def getRoomInfos(self, access_token, room_request, stream=False):
         """
         Get room information.
 
         Args:
             access_token (str): The JWT proving authorisation.
             room_request (str): The room request.
+            stream (bool, optional): Whether to defer downloading the body (so it can be parsed incrementally with serialisation.iter_items, the HTTP/2 session and AsyncCondeco always download it first).
 
         Returns:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Send the room information request.
-        response = self.session.post(
-            url=f'https://{self.unique_key}/MobileAPI/MobileService.svc/RoomBookings/RoomInfo',
+        return self._request(
+            method='POST',
+            url=f'{self.base_url}/MobileAPI/MobileService.svc/RoomBookings/RoomInfo',
             headers=headers,
             json=room_request,
-            timeout=Condeco.TIMEOUT
+            stream=stream
         )
 
-        # Return the response.
-        return response
-
+    @cached(ttl=600)
     def getSelfCertificationContent(self, access_token, session_token, location_id):
         """
         Get self certification content.
@@ -972,17 +1267,14 @@ class Condeco:
         Args:
             access_token (str): The JWT proving authorisation.
             session_token (str): The opaque session access token.
-            location_id (int): The location identification number to find certification status.
+            location_id (int): The location identification number to find certification content for.
 
         Returns:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Query parameters.
         params = {
@@ -991,16 +1283,13 @@ class Condeco:
         }
 
         # Send the self certification content request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/MobileAPI/DeskBookingService.svc/SelfCertificationContent',
+        return self._request(
+            method='GET',
+            url=f'{self.base_url}/MobileAPI/DeskBookingService.svc/SelfCertificationContent',
             params=params,
-            headers=headers,
-            timeout=Condeco.TIMEOUT
+            headers=headers
         )
 
-        # Return the response.
-        return response
-
     def getSelfCertificationStatus(self, access_token, session_token, location_id):
         """
         Get self certification status.
@@ -1014,11 +1303,8 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Query parameters.
         params = {
@@ -1027,16 +1313,13 @@ class Condeco:
         }
 
         # Send the self certification status request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/MobileAPI/DeskBookingService.svc/SelfCertificationStatus',
+        return self._request(
+            method='GET',
+            url=f'{self.base_url}/MobileAPI/DeskBookingService.svc/SelfCertificationStatus',
             params=params,
-            headers=headers,
-            timeout=Condeco.TIMEOUT
+            headers=headers
         )
 
-        # Return the response.
-        return response
-
     def getSessionToken(self, access_token):
         """
         Get session token.
@@ -1048,22 +1331,17 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Send the session token request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/mobileapi/MobileService.svc/User/GetSessionToken',
-            headers=headers,
-            timeout=Condeco.TIMEOUT
+        return self._request(
+            method='GET',
+            url=f'{self.base_url}/mobileapi/MobileService.svc/User/GetSessionToken',
+            headers=headers
         )
 
-        # Return the response.
-        return response
-
+    @cached(ttl=600)
     def globalSettings(self):
         """
         Get the global settings.
@@ -1072,17 +1350,83 @@ class Condeco:
             Response: The full response object.
         """
 
+        # Any previous response is revalidated (so the server need only confirm it is unchanged).
+        previous = self.global_settings_response
+        headers = Condeco.conditional_headers(previous) if previous is not None else None
+
         # Send the global settings request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/mobileapi/MobileService.svc/Configuration/GetGlobalSettings',
-            headers=Condeco.HEADERS,
-            timeout=Condeco.TIMEOUT
+        response = self._request(
+            method='GET',
+            url=f'{self.base_url}/mobileapi/MobileService.svc/Configuration/GetGlobalSettings',
+            headers=headers
         )
 
+        # AsyncCondeco's response has to be awaited before it can be checked.
+        if inspect.isawaitable(response):
+            async def revalidate():
+                return self._revalidate_global_settings(previous, await response)
+
+            return revalidate()
+
+        return self._revalidate_global_settings(previous, response)
+
+    def _revalidate_global_settings(self, previous, response):
+        # The settings have not changed since the previous response.
+        if _status_code(response) == 304 and previous is not None:
+            return previous
+
+        # Otherwise remember these settings for next time.
+        if _status_code(response) == 200:
+            self.global_settings_response = response
+
         # Return the response.
         return response
 
-    def listBookings(self, access_token, session_token, language_id, desk_start_date, desk_end_date, room_start_date, time_zone_id, page_size, page_index):
+    def iterListBookings(self, access_token, session_token, language_id, desk_start_date, desk_end_date, room_start_date, time_zone_id, page_size, page_indexes):
+        """
+        Get each page of booking information in turn (the next page is requested while the caller handles the current one).
+
+        Args:
+            access_token (str): The JWT proving authorisation.
+            session_token (str): The opaque session access token.
+            language_id (int): The language id.
+            desk_start_date (str): The desk start date.
+            desk_end_date (str): The desk end date.
+            room_start_date (str): The room start date.
+            time_zone_id (int): The time zone identifier.
+            page_size (int): The number of records on each page.
+            page_indexes (iterable of int): The page numbers to request (e.g. range(4) for the first four pages, the ListV2 response has no documented total to stop on).
+
+        Returns:
+            generator: Each of the full response objects (in the same order as page_indexes).
+        """
+
+        # Only one page is requested ahead (the server, rather than the caller, is the bottleneck).
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = None
+            for page_index in page_indexes:
+                # Request this page before handing over the previous one.
+                next_future = executor.submit(
+                    self.listBookings,
+                    access_token=access_token,
+                    session_token=session_token,
+                    language_id=language_id,
+                    desk_start_date=desk_start_date,
+                    desk_end_date=desk_end_date,
+                    room_start_date=room_start_date,
+                    time_zone_id=time_zone_id,
+                    page_size=page_size,
+                    page_index=page_index
+                )
+                if future is not None:
+                    yield future.result()
+                future = next_future
+
+            # Hand over the last page.
+            if future is not None:
+                yield future.result()
+
+    def listBookings(self, access_token, session_token, language_id, desk_start_date, desk_end_date, room_start_date, time_zone_id, page_size, page_index, stream=False):
         """
         Get booking information.
 
@@ -1096,16 +1440,14 @@ class Condeco:
             time_zone_id (int): The time zone identifier.
             page_size (int): The number of records on each page.
             page_index (int): The page number to request.
+            stream (bool, optional): Whether to defer downloading the body (so it can be parsed incrementally with serialisation.iter_items, the HTTP/2 session and AsyncCondeco always download it first).
 
         Returns:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Query parameters.
         params = {
@@ -1120,16 +1462,15 @@ class Condeco:
         }
 
         # Send the booking information request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/MobileAPI/MobileService.svc/MyBookings/ListV2',
+        return self._request(
+            method='GET',
+            url=f'{self.base_url}/MobileAPI/MobileService.svc/MyBookings/ListV2',
             params=params,
             headers=headers,
-            timeout=Condeco.TIMEOUT
+            stream=stream,
+            timeout=self.SEARCH_TIMEOUT
         )
 
-        # Return the response.
-        return response
-
     def loginWithMagicLink(self, validation_key):
         """
         Login with magic link.
@@ -1142,16 +1483,12 @@ class Condeco:
         """
 
         # Send the login request.
-        response = self.session.post(
-            url=f'https://{self.unique_key}/MobileAPI/MobileService.svc/User/LoginWithMagicLink',
-            headers=Condeco.HEADERS,
-            json={'validationKey':validation_key},
-            timeout=Condeco.TIMEOUT
+        return self._request(
+            method='POST',
+            url=f'{self.base_url}/MobileAPI/MobileService.svc/User/LoginWithMagicLink',
+            json={'validationKey':validation_key}
         )
 
-        # Return the response.
-        return response
-
     def releaseDesk(self, access_token, session_token, location_id, desk_id):
         """
         Release desk.
@@ -1166,11 +1503,8 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Query parameters.
         params = {
@@ -1180,15 +1514,42 @@ class Condeco:
         }
 
         # Send the release desk request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/MobileAPI/DeskBookingService.svc/Release',
+        return self._request(
+            method='GET',
+            url=f'{self.base_url}/MobileAPI/DeskBookingService.svc/Release',
             params=params,
-            headers=headers,
-            timeout=Condeco.TIMEOUT
+            headers=headers
         )
 
-        # Return the response.
-        return response
+    def releaseDeskBatch(self, access_token, session_token, location_id, desk_ids, max_workers=8):
+        """
+        Release several desks at the same time.
+
+        Args:
+            access_token (str): The JWT proving authorisation.
+            session_token (str): The opaque session access token.
+            location_id (int): The location identifier.
+            desk_ids (list of int): The desk identifiers.
+            max_workers (int, optional): The maximum number of requests in flight at once (at most the max_concurrency the client was created with).
+
+        Returns:
+            list of Response: The full response objects (in the same order as desk_ids).
+        """
+
+        # Send each release desk request at once (the session is safe to share between threads).
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self.releaseDesk,
+                    access_token=access_token,
+                    session_token=session_token,
+                    location_id=location_id,
+                    desk_id=desk_id
+                ) for desk_id in desk_ids
+            ]
+
+        # Return each of the responses (raising any exception a request raised).
+        return [future.result() for future in futures]
 
     def roomSearch(self, access_token, room_search_criteria):
         """
@@ -1202,23 +1563,18 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Send the room search request.
-        response = self.session.post(
-            url=f'https://{self.unique_key}/mobileapi/MobileService.svc/RoomBookings/RoomSearch',
+        return self._request(
+            method='POST',
+            url=f'{self.base_url}/mobileapi/MobileService.svc/RoomBookings/RoomSearch',
             headers=headers,
             json=room_search_criteria,
-            timeout=Condeco.TIMEOUT
+            timeout=self.SEARCH_TIMEOUT
         )
 
-        # Return the response.
-        return response
-
     def roomSearchByFeatures(self, access_token, room_search_request_with_features):
         """
         Search for room with specific features.
@@ -1231,23 +1587,18 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Send the room search request with features.
-        response = self.session.post(
-            url=f'https://{self.unique_key}/MobileAPI/MobileService.svc/RoomBookings/RoomSearchByFeatures',
+        return self._request(
+            method='POST',
+            url=f'{self.base_url}/MobileAPI/MobileService.svc/RoomBookings/RoomSearchByFeatures',
             headers=headers,
             json=room_search_request_with_features,
-            timeout=Condeco.TIMEOUT
+            timeout=self.SEARCH_TIMEOUT
         )
 
-        # Return the response.
-        return response
-
     def saveDefaultSettings(self, access_token, settings_request):
         """
         Save default settings.
@@ -1260,24 +1611,18 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Send the save default settings request.
-        response = self.session.post(
-            url=f'https://{self.unique_key}/MobileAPI/MobileService.svc/User/SaveDefaultSettingsV2',
+        return self._request(
+            method='POST',
+            url=f'{self.base_url}/MobileAPI/MobileService.svc/User/SaveDefaultSettingsV2',
             headers=headers,
-            json=settings_request,
-            timeout=Condeco.TIMEOUT
+            json=settings_request
         )
 
-        # Return the response.
-        return response
-
-    def search(self, access_token, session_token, user_id, location_id, group_id, floor_id, start_date, booking_type, ws_type_id):
+    def search(self, access_token, session_token, user_id, location_id, group_id, floor_id, start_date, booking_type, ws_type_id, stream=False):
         """
         Search for a desk.
 
@@ -1291,16 +1636,14 @@ class Condeco:
             start_date (str): The start date.
             booking_type (int): The booking type.
             ws_type_id (int, optional): The workstation type identifier.
+            stream (bool, optional): Whether to defer downloading the body (so it can be parsed incrementally with serialisation.iter_items, the HTTP/2 session and AsyncCondeco always download it first).
 
         Returns:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Query parameters.
         params = {
@@ -1315,16 +1658,15 @@ class Condeco:
         }
 
         # Send the desk search request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/MobileAPI/DeskBookingService.svc/Search',
+        return self._request(
+            method='GET',
+            url=f'{self.base_url}/MobileAPI/DeskBookingService.svc/Search',
             params=params,
             headers=headers,
-            timeout=Condeco.TIMEOUT
+            stream=stream,
+            timeout=self.SEARCH_TIMEOUT
         )
 
-        # Return the response.
-        return response
-
     def searchAllByRoomFeatures(self, access_token, room_search_request_with_features):
         """
         Search for room with specific features.
@@ -1337,22 +1679,54 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Send the room search request with features.
-        response = self.session.post(
-            url=f'https://{self.unique_key}/MobileAPI/MobileService.svc/RoomBookings/SearchAllByRoomFeatures',
+        return self._request(
+            method='POST',
+            url=f'{self.base_url}/MobileAPI/MobileService.svc/RoomBookings/SearchAllByRoomFeatures',
             headers=headers,
             json=room_search_request_with_features,
-            timeout=Condeco.TIMEOUT
+            timeout=self.SEARCH_TIMEOUT
         )
 
-        # Return the response.
-        return response
+    def searchByFeaturesBatch(self, access_token, desk_search_request_with_features, room_search_request_with_features, all_room_search_request_with_features):
+        """
+        Search for desks, rooms and all rooms with specific features at the same time.
+
+        Args:
+            access_token (str): The JWT proving authorisation.
+            desk_search_request_with_features (str): The desk search request with features.
+            room_search_request_with_features (str): The room search request with features.
+            all_room_search_request_with_features (str): The room search request with features for all rooms.
+
+        Returns:
+            tuple of Response: The full response objects of searchDeskByFeatures, roomSearchByFeatures and searchAllByRoomFeatures (in that order).
+        """
+
+        # Send the three search requests at once (the session is safe to share between threads).
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            futures = (
+                executor.submit(
+                    self.searchDeskByFeatures,
+                    access_token=access_token,
+                    desk_search_request_with_features=desk_search_request_with_features
+                ),
+                executor.submit(
+                    self.roomSearchByFeatures,
+                    access_token=access_token,
+                    room_search_request_with_features=room_search_request_with_features
+                ),
+                executor.submit(
+                    self.searchAllByRoomFeatures,
+                    access_token=access_token,
+                    room_search_request_with_features=all_room_search_request_with_features
+                )
+            )
+
+        # Return each of the responses (raising any exception a request raised).
+        return tuple(future.result() for future in futures)
 
     def searchDeskByFeatures(self, access_token, desk_search_request_with_features):
         """
@@ -1366,23 +1740,18 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Send the desk search request with features.
-        response = self.session.post(
-            url=f'https://{self.unique_key}/MobileAPI/DeskBookingService.svc/DeskSearchByFeatures',
+        return self._request(
+            method='POST',
+            url=f'{self.base_url}/MobileAPI/DeskBookingService.svc/DeskSearchByFeatures',
             headers=headers,
             json=desk_search_request_with_features,
-            timeout=Condeco.TIMEOUT
+            timeout=self.SEARCH_TIMEOUT
         )
 
-        # Return the response.
-        return response
-
     def selfCertifyUser(self, access_token, self_certify_user_request):
         """
         Self certify user.
@@ -1395,23 +1764,17 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Send the self certify user request.
-        response = self.session.post(
-            url=f'https://{self.unique_key}/MobileAPI/DeskBookingService.svc/SelfCertifyUser',
+        return self._request(
+            method='POST',
+            url=f'{self.base_url}/MobileAPI/DeskBookingService.svc/SelfCertifyUser',
             headers=headers,
-            json=self_certify_user_request,
-            timeout=Condeco.TIMEOUT
+            json=self_certify_user_request
         )
 
-        # Return the response.
-        return response
-
     def sendMagicLink(self, email):
         """
         Start the magic link authentication process.
@@ -1424,16 +1787,12 @@ class Condeco:
         """
 
         # Send the magic link request.
-        response = self.session.post(
-            url=f'https://{self.unique_key}/MobileAPI/MobileService.svc/User/SendMagicLink',
-            headers=Condeco.HEADERS,
-            json={'email':email},
-            timeout=Condeco.TIMEOUT
+        return self._request(
+            method='POST',
+            url=f'{self.base_url}/MobileAPI/MobileService.svc/User/SendMagicLink',
+            json={'email':email}
         )
 
-        # Return the response.
-        return response
-
     def startBooking(self, access_token, start_booking_request):
         """
         Start a room booking request.
@@ -1446,23 +1805,17 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Send the start room booking request.
-        response = self.session.put(
-            url=f'https://{self.unique_key}/MobileAPI/MobileService.svc/RoomBookings/Start',
+        return self._request(
+            method='PUT',
+            url=f'{self.base_url}/MobileAPI/MobileService.svc/RoomBookings/Start',
             headers=headers,
-            json=start_booking_request,
-            timeout=Condeco.TIMEOUT
+            json=start_booking_request
         )
 
-        # Return the response.
-        return response
-
     def teamDayAcceptDecline(self, access_token, team_day_accept_decline_request):
         """
         Team day response.
@@ -1475,23 +1828,17 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Send the team day response.
-        response = self.session.post(
-            url=f'https://{self.unique_key}/MobileAPI/MobileService.svc/team/TeamDayAcceptDecline',
+        return self._request(
+            method='POST',
+            url=f'{self.base_url}/MobileAPI/MobileService.svc/team/TeamDayAcceptDecline',
             headers=headers,
-            json=team_day_accept_decline_request,
-            timeout=Condeco.TIMEOUT
+            json=team_day_accept_decline_request
         )
 
-        # Return the response.
-        return response
-
     def teamMemberOperation(self, access_token, team_member_operation_request):
         """
         Team member operation request.
@@ -1504,22 +1851,42 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Send the team member operation request.
-        response = self.session.post(
-            url=f'https://{self.unique_key}/MobileAPI/MobileService.svc/team/TeamMemberOperation',
+        return self._request(
+            method='POST',
+            url=f'{self.base_url}/MobileAPI/MobileService.svc/team/TeamMemberOperation',
             headers=headers,
-            json=team_member_operation_request,
-            timeout=Condeco.TIMEOUT
+            json=team_member_operation_request
         )
 
-        # Return the response.
-        return response
+    def teamMemberOperationBatch(self, access_token, team_member_operation_requests, max_workers=8):
+        """
+        Send several team member operation requests at the same time.
+
+        Args:
+            access_token (str): The JWT access token for authentication.
+            team_member_operation_requests (list of str): The team member operation requests.
+            max_workers (int, optional): The maximum number of requests in flight at once (at most the max_concurrency the client was created with).
+
+        Returns:
+            list of Response: The full response objects (in the same order as team_member_operation_requests).
+        """
+
+        # Send each team member operation request at once (the session is safe to share between threads).
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self.teamMemberOperation,
+                    access_token=access_token,
+                    team_member_operation_request=team_member_operation_request
+                ) for team_member_operation_request in team_member_operation_requests
+            ]
+
+        # Return each of the responses (raising any exception a request raised).
+        return [future.result() for future in futures]
 
     def updateAttendanceRecord(self, access_token, session_token, start_date, end_date, attendance_type, location_id):
         """
@@ -1537,11 +1904,8 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Query parameters.
         params = {
@@ -1553,16 +1917,13 @@ class Condeco:
         }
 
         # Send the update attendance record request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/MobileAPI/DeskBookingService.svc/UpdateAttendanceRecord',
+        return self._request(
+            method='GET',
+            url=f'{self.base_url}/MobileAPI/DeskBookingService.svc/UpdateAttendanceRecord',
             params=params,
-            headers=headers,
-            timeout=Condeco.TIMEOUT
+            headers=headers
         )
 
-        # Return the response.
-        return response
-
     def updateBooking(self, access_token, update_booking_request):
         """
         Update a room booking.
@@ -1575,23 +1936,17 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Send the update room booking request.
-        response = self.session.put(
-            url=f'https://{self.unique_key}/MobileAPI/MobileService.svc/RoomBookings/Update',
+        return self._request(
+            method='PUT',
+            url=f'{self.base_url}/MobileAPI/MobileService.svc/RoomBookings/Update',
             headers=headers,
-            json=update_booking_request,
-            timeout=Condeco.TIMEOUT
+            json=update_booking_request
         )
 
-        # Return the response.
-        return response
-
     def updateDefaultSettings(self, access_token, session_token, country_id, location_id, group_id, floor_id):
         """
         Update default desk booking settings.
@@ -1608,11 +1963,8 @@ class Condeco:
             Response: The full response object.
         """
 
-        # Create a copy of the original header dictionary.
-        headers = Condeco.HEADERS.copy()
-
-        # We append an OAuth 2.0 bearer token.
-        headers['Authorization'] = f'Bearer {access_token}'
+        # We send an OAuth 2.0 bearer token, if it has not expired (the session already sends the common headers).
+        headers = Condeco.authorisation_headers(access_token)
 
         # Query parameters.
         params = {
@@ -1624,12 +1976,9 @@ class Condeco:
         }
 
         # Send the update default settings request.
-        response = self.session.get(
-            url=f'https://{self.unique_key}/MobileAPI/DeskBookingService.svc/SaveDefaultSettings',
+        return self._request(
+            method='GET',
+            url=f'{self.base_url}/MobileAPI/DeskBookingService.svc/SaveDefaultSettings',
             params=params,
-            headers=headers,
-            timeout=Condeco.TIMEOUT
+            headers=headers
         )
-
-        # Return the response.
-        return response
\ No newline at end of file
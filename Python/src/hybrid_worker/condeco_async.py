@@ -0,0 +1,406 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of Hybrid-Worker <https://github.com/Matthew1471/Hybrid-Worker>
+# Copyright (C) 2023 Matthew1471!
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Condeco Asynchronous Module
+This module provides an asyncio based equivalent of the Condeco class.
+It allows many requests to the Condeco® software to be in flight at the same time.
+"""
+
+# We limit how many requests are in flight at once.
+import asyncio
+
+# Third party library for making asynchronous HTTP(S) requests;
+# "pip install aiohttp" if getting import errors.
+import aiohttp
+
+# Every request (along with the headers and timeouts) is defined by the synchronous client.
+from .condeco import Condeco
+
+# We encode JSON request bodies.
+from . import serialisation
+
+
+class AsyncCondeco(Condeco):
+    """
+    A class to talk to Condeco®'s Cloud based software asynchronously.
+
+    Every method is inherited from the Condeco class (so each request is only defined once),
+    but the requests are sent with aiohttp (so each call has to be awaited).
+
+    The class should be used as an asynchronous context manager so the underlying
+    session (and its pooled connections) is closed once finished with.
+    """
+
+    # Instances only ever have these attributes in addition to Condeco's (so no per-instance dictionary is needed).
+    __slots__ = ('max_concurrency', 'semaphore')
+
+    # This sets the same connect and read timeouts as the synchronous client.
+    TIMEOUT = aiohttp.ClientTimeout(sock_connect=Condeco.TIMEOUT[0], sock_read=Condeco.TIMEOUT[1])
+    SEARCH_TIMEOUT = aiohttp.ClientTimeout(sock_connect=Condeco.SEARCH_TIMEOUT[0], sock_read=Condeco.SEARCH_TIMEOUT[1])
+
+    # Parameterized constructor.
+    def __init__(self, unique_key, max_concurrency=8):
+        """
+        Initalise the AsyncCondeco class with a unique_key.
+
+        Args:
+            unique_key (str): The hostname of the Condeco instance.
+            max_concurrency (int, optional): The maximum number of requests in flight at once.
+        """
+
+        # The Condeco® instance to interact with.
+        self.unique_key = unique_key
+
+        # Every request is sent to this instance (so the start of each URL is only built once).
+        self.base_url = f'https://{unique_key}'
+
+        # Responses from the rarely changing endpoints are re-used for a while (clear this to fetch them again).
+        self.response_cache = {}
+
+        # The last global settings response (so the settings are only downloaded again once they change).
+        self.global_settings_response = None
+
+        # Past a point more concurrent requests only slow the server down (so they queue here instead).
+        self.max_concurrency = max_concurrency
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+
+        # The session is created when entering the context (it requires a running event loop).
+        self.session = None
+
+    async def __aenter__(self):
+        # Using a single ClientSession means aiohttp supports keep-alives and re-uses connections.
+        self.session = aiohttp.ClientSession(
+            # The session sends these headers with every request.
+            headers=Condeco.HEADERS,
+
+            # Pool no more connections than there can be requests in flight.
+            # (the one host is looked up again at most every 5 minutes rather than every 10 seconds).
+            connector=aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=self.max_concurrency, ttl_dns_cache=300),
+
+            # Do not accept any cookies (especially ARRAffinity).
+            cookie_jar=aiohttp.DummyCookieJar()
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def __enter__(self):
+        # Like aiohttp's ClientSession, the session can only be closed asynchronously.
+        raise TypeError('Use "async with" instead')
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    async def close(self):
+        """
+        Close the underlying session and any pooled connections.
+        """
+
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def _request(self, method, url, headers=None, params=None, json=None, timeout=None, **kwargs):
+        # Unlike Requests, aiohttp does not silently drop query parameters that are not set.
+        if params is not None:
+            params = {key: value for key, value in params.items() if value is not None}
+
+        # Encode any JSON body ourselves (so the faster encoder is used when available).
+        if json is not None:
+            kwargs['data'] = serialisation.dumps(json)
+            headers = {**(headers or {}), **Condeco.JSON_HEADERS}
+
+        # The body is always read before returning (so there is nothing to stream).
+        kwargs.pop('stream', None)
+
+        # Send the request (once a slot is free).
+        async with self.semaphore:
+            response = await self.session.request(method=method, url=url, headers=headers, params=params, timeout=timeout or AsyncCondeco.TIMEOUT, **kwargs)
+
+            # Reading the whole body returns the connection to the pool (while leaving the body available to the caller).
+            await response.read()
+
+        # Return the response.
+        return response
+
+    async def getAttendancesRecordBatch(self, access_token, session_token, start_date, end_date, user_ids):
+        """
+        Get attendance records for several users at the same time.
+
+        Args:
+            access_token (str): The JWT proving authorisation.
+            session_token (str): The opaque session access token.
+            start_date (str): The start date to find booking information for.
+            end_date (str): The end date to find booking information for.
+            user_ids (list of int): The user identification numbers to find booking information for.
+
+        Returns:
+            list of ClientResponse: The full response objects (in the same order as user_ids).
+        """
+
+        # Send each attendance record request at once (the semaphore still limits how many are in flight).
+        return await asyncio.gather(*(
+            self.getAttendancesRecord(
+                access_token=access_token,
+                session_token=session_token,
+                start_date=start_date,
+                end_date=end_date,
+                user_id=user_id
+            ) for user_id in user_ids
+        ))
+
+    async def getColleagueBookingsBatch(self, access_token, session_token, start_date, end_date, time_zone_id, user_ids):
+        """
+        Get colleague booking records for several users at the same time.
+
+        Args:
+            access_token (str): The JWT proving authorisation.
+            session_token (str): The opaque session access token.
+            start_date (str): The start date to find booking information for.
+            end_date (str): The end date to find booking information for.
+            time_zone_id (str): The time zone.
+            user_ids (list of int): The user identification numbers to find booking information for.
+
+        Returns:
+            list of ClientResponse: The full response objects (in the same order as user_ids).
+        """
+
+        # Send each colleague bookings request at once (the semaphore still limits how many are in flight).
+        return await asyncio.gather(*(
+            self.getColleagueBookings(
+                access_token=access_token,
+                session_token=session_token,
+                start_date=start_date,
+                end_date=end_date,
+                time_zone_id=time_zone_id,
+                user_id=user_id
+            ) for user_id in user_ids
+        ))
+
+    async def getFloorPlanBatch(self, access_token, session_token, location_id, group_id, floor_ids):
+        """
+        Get the floor plans for several floors at the same time.
+
+        Args:
+            access_token (str): The JWT proving authorisation.
+            session_token (str): The opaque session access token.
+            location_id (int): The location the floors are in.
+            group_id (int): The group the floors are in.
+            floor_ids (list of int): The floor identification numbers (a floor listed more than once is only requested once).
+
+        Returns:
+            list of ClientResponse: The full response objects (in the same order as floor_ids).
+        """
+
+        # Send each distinct floor plan request at once (the semaphore still limits how many are in flight).
+        unique_floor_ids = list(dict.fromkeys(floor_ids))
+        responses = await asyncio.gather(*(
+            self.getFloorPlan(
+                access_token=access_token,
+                session_token=session_token,
+                location_id=location_id,
+                group_id=group_id,
+                floor_id=floor_id
+            ) for floor_id in unique_floor_ids
+        ))
+
+        # Return the responses in the order the floors were asked for.
+        responses = dict(zip(unique_floor_ids, responses))
+        return [responses[floor_id] for floor_id in floor_ids]
+
+    async def iterListBookings(self, access_token, session_token, language_id, desk_start_date, desk_end_date, room_start_date, time_zone_id, page_size, page_indexes):
+        """
+        Get each page of booking information in turn (the next page is requested while the caller handles the current one).
+
+        Args:
+            access_token (str): The JWT proving authorisation.
+            session_token (str): The opaque session access token.
+            language_id (int): The language id.
+            desk_start_date (str): The desk start date.
+            desk_end_date (str): The desk end date.
+            room_start_date (str): The room start date.
+            time_zone_id (int): The time zone identifier.
+            page_size (int): The number of records on each page.
+            page_indexes (iterable of int): The page numbers to request (e.g. range(4) for the first four pages, the ListV2 response has no documented total to stop on).
+
+        Returns:
+            async generator: Each of the full response objects (in the same order as page_indexes).
+        """
+
+        # Only one page is requested ahead (the server, rather than the caller, is the bottleneck).
+        task = None
+        try:
+            for page_index in page_indexes:
+                # Request this page before handing over the previous one.
+                next_task = asyncio.ensure_future(
+                    self.listBookings(
+                        access_token=access_token,
+                        session_token=session_token,
+                        language_id=language_id,
+                        desk_start_date=desk_start_date,
+                        desk_end_date=desk_end_date,
+                        room_start_date=room_start_date,
+                        time_zone_id=time_zone_id,
+                        page_size=page_size,
+                        page_index=page_index
+                    )
+                )
+                if task is not None:
+                    yield await task
+                task = next_task
+
+            # Hand over the last page.
+            if task is not None:
+                yield await task
+                task = None
+        finally:
+            # A page the caller stopped before is not needed.
+            if task is not None:
+                task.cancel()
+
+    async def listBookingsBatch(self, access_token, session_token, language_id, desk_start_date, desk_end_date, room_start_date, time_zone_id, page_size, page_indexes):
+        """
+        Get several pages of booking information at the same time.
+
+        Args:
+            access_token (str): The JWT proving authorisation.
+            session_token (str): The opaque session access token.
+            language_id (int): The language id.
+            desk_start_date (str): The desk start date.
+            desk_end_date (str): The desk end date.
+            room_start_date (str): The room start date.
+            time_zone_id (int): The time zone identifier.
+            page_size (int): The number of records on each page.
+            page_indexes (list of int): The page numbers to request (e.g. range(4) for the first four pages).
+
+        Returns:
+            list of ClientResponse: The full response objects (in the same order as page_indexes).
+        """
+
+        # Send each page request at once (the semaphore still limits how many are in flight).
+        return await asyncio.gather(*(
+            self.listBookings(
+                access_token=access_token,
+                session_token=session_token,
+                language_id=language_id,
+                desk_start_date=desk_start_date,
+                desk_end_date=desk_end_date,
+                room_start_date=room_start_date,
+                time_zone_id=time_zone_id,
+                page_size=page_size,
+                page_index=page_index
+            ) for page_index in page_indexes
+        ))
+
+    async def releaseDeskBatch(self, access_token, session_token, location_id, desk_ids):
+        """
+        Release several desks at the same time.
+
+        Args:
+            access_token (str): The JWT proving authorisation.
+            session_token (str): The opaque session access token.
+            location_id (int): The location identifier.
+            desk_ids (list of int): The desk identifiers.
+
+        Returns:
+            list of ClientResponse: The full response objects (in the same order as desk_ids).
+        """
+
+        # Send each release desk request at once (the semaphore still limits how many are in flight).
+        return await asyncio.gather(*(
+            self.releaseDesk(
+                access_token=access_token,
+                session_token=session_token,
+                location_id=location_id,
+                desk_id=desk_id
+            ) for desk_id in desk_ids
+        ))
+
+    async def searchBatch(self, access_token, session_token, searches):
+        """
+        Search for available desks with several different criteria at the same time.
+
+        Args:
+            access_token (str): The JWT proving authorisation.
+            session_token (str): The opaque session access token.
+            searches (list of dict): The remaining search arguments for each search (user_id, location_id, group_id, floor_id, start_date, booking_type and ws_type_id).
+
+        Returns:
+            list of ClientResponse: The full response objects (in the same order as searches).
+        """
+
+        # Send each search request at once (the semaphore still limits how many are in flight).
+        return await asyncio.gather(*(
+            self.search(
+                access_token=access_token,
+                session_token=session_token,
+                **search
+            ) for search in searches
+        ))
+
+    async def searchByFeaturesBatch(self, access_token, desk_search_request_with_features, room_search_request_with_features, all_room_search_request_with_features):
+        """
+        Search for desks, rooms and all rooms with specific features at the same time.
+
+        Args:
+            access_token (str): The JWT proving authorisation.
+            desk_search_request_with_features (str): The desk search request with features.
+            room_search_request_with_features (str): The room search request with features.
+            all_room_search_request_with_features (str): The room search request with features for all rooms.
+
+        Returns:
+            tuple of ClientResponse: The full response objects of searchDeskByFeatures, roomSearchByFeatures and searchAllByRoomFeatures (in that order).
+        """
+
+        # Send the three search requests at once (the semaphore still limits how many are in flight).
+        return tuple(await asyncio.gather(
+            self.searchDeskByFeatures(
+                access_token=access_token,
+                desk_search_request_with_features=desk_search_request_with_features
+            ),
+            self.roomSearchByFeatures(
+                access_token=access_token,
+                room_search_request_with_features=room_search_request_with_features
+            ),
+            self.searchAllByRoomFeatures(
+                access_token=access_token,
+                room_search_request_with_features=all_room_search_request_with_features
+            )
+        ))
+
+    async def teamMemberOperationBatch(self, access_token, team_member_operation_requests):
+        """
+        Send several team member operation requests at the same time.
+
+        Args:
+            access_token (str): The JWT access token for authentication.
+            team_member_operation_requests (list of str): The team member operation requests.
+
+        Returns:
+            list of ClientResponse: The full response objects (in the same order as team_member_operation_requests).
+        """
+
+        # Send each team member operation request at once (the semaphore still limits how many are in flight).
+        return await asyncio.gather(*(
+            self.teamMemberOperation(
+                access_token=access_token,
+                team_member_operation_request=team_member_operation_request
+            ) for team_member_operation_request in team_member_operation_requests
+        ))
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of Hybrid-Worker <https://github.com/Matthew1471/Hybrid-Worker>
+# Copyright (C) 2023 Matthew1471!
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+HTTP/2 Module
+This module provides an HTTP/2 session for talking to the Condeco® software.
+It offers just enough of the Requests session interface for the Condeco class to use it instead.
+"""
+
+# Third party library for making HTTP/2 requests;
+# "pip install httpx[http2]" if getting import errors.
+import httpx
+
+# We discard cookies.
+from .condeco import DummyCookieJar
+
+
+class HTTP2Session:
+    """
+    A Requests style session that multiplexes requests over a single HTTP/2 connection.
+    """
+
+    # Parameterized constructor.
+    def __init__(self, headers, retries=3, max_connections=16):
+        """
+        Initalise the HTTP2Session class.
+
+        Args:
+            headers (dict): The headers to send with every request.
+            retries (int, optional): The number of times to retry failed connection attempts.
+            max_connections (int, optional): The maximum number of connections to keep open.
+        """
+
+        # A single connection carries many concurrent requests (so few connections are needed).
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+
+        # Using a single Client means httpx supports keep-alives and re-uses the connection.
+        self.client = httpx.Client(
+            headers=headers,
+
+            # Do not accept any cookies (especially ARRAffinity).
+            cookies=DummyCookieJar(),
+
+            transport=httpx.HTTPTransport(http2=True, retries=retries, limits=limits)
+        )
+
+    def request(self, method, url, params=None, headers=None, data=None, timeout=None, stream=False):
+        """
+        Send a request.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL to request.
+            params (dict, optional): The query parameters (any that are None are not sent).
+            headers (dict, optional): Any headers to send in addition to the session headers.
+            data (bytes, optional): The request body.
+            timeout (tuple, optional): The connect and read timeouts (in seconds).
+            stream (bool, optional): Ignored (the body is always downloaded before returning).
+
+        Returns:
+            Response: The full response object.
+        """
+
+        # Like Requests, query parameters that are not set are not sent.
+        if params is not None:
+            params = {key: value for key, value in params.items() if value is not None}
+
+        # Requests takes a (connect, read) tuple.
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+
+        # Send the request.
+        return self.client.request(method=method, url=url, params=params, headers=headers, content=data, timeout=timeout)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request('PUT', url, **kwargs)
+
+    def close(self):
+        """
+        Close the underlying client and its connections.
+        """
+
+        self.client.close()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# This file is part of Hybrid-Worker <https://github.com/Matthew1471/Hybrid-Worker>
+# Copyright (C) 2023 Matthew1471!
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License version 3 as
+# published by the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Serialisation Module
+This module provides the JSON encoding and decoding used with the Condeco® software.
+It uses orjson when it is installed and falls back to the standard library otherwise.
+Large responses can also be parsed incrementally when ijson is installed.
+"""
+
+# orjson (de)serialises JSON considerably faster than the standard library;
+# "pip install orjson" to use it.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+    # The standard library is used instead.
+    import json
+
+# ijson parses JSON incrementally (so large responses need not be held in memory at once);
+# "pip install ijson" to use it.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def dumps(obj):
+    """
+    Serialise an object to JSON.
+
+    Args:
+        obj (object): The object to serialise.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON.
+    """
+
+    # Use orjson if available.
+    if orjson:
+        return orjson.dumps(obj)
+
+    return json.dumps(obj).encode('utf-8')
+
+def loads(data):
+    """
+    Deserialise JSON to an object.
+
+    Args:
+        data (bytes or str): The JSON to deserialise.
+
+    Returns:
+        object: The deserialised object.
+    """
+
+    # Use orjson if available.
+    if orjson:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+def iter_items(response, prefix, chunk_size=65536):
+    """
+    Incrementally parse the JSON values found at a prefix of a response.
+
+    Args:
+        response (Response): The response to parse (requested with stream=True so the body is not yet downloaded).
+        prefix (str): The ijson style path to the values (e.g. "SearchedDesks.item" for each desk in that list).
+        chunk_size (int, optional): The number of bytes to parse at a time.
+
+    Returns:
+        generator: Each of the deserialised values (in the order they appear in the response).
+    """
+
+    # Without ijson the whole body is deserialised first.
+    if not ijson:
+        yield from _walk(loads(response.content), prefix.split('.') if prefix else [])
+        return
+
+    # The values are collected as each chunk is parsed (numbers are returned as float rather than Decimal to match the other parsers).
+    values = ijson.sendable_list()
+    parser = ijson.items_coro(values, prefix, use_float=True)
+    for chunk in _iter_chunks(response, chunk_size):
+        parser.send(chunk)
+        yield from values
+        del values[:]
+
+    # Signal the end of the body.
+    parser.close()
+    yield from values
+
+def _iter_chunks(response, chunk_size):
+    # Requests undoes any gzip encoding as the body is read.
+    if hasattr(response, 'iter_content'):
+        return response.iter_content(chunk_size=chunk_size)
+
+    # httpx (used by the HTTP/2 session, which has already downloaded the body) decodes it the same way.
+    if hasattr(response, 'iter_bytes'):
+        return response.iter_bytes(chunk_size=chunk_size)
+
+    # Otherwise the body can only be parsed all at once.
+    return (response.content,)
+
+def _walk(value, keys):
+    # The path has been followed.
+    if not keys:
+        yield value
+
+    # Like ijson, "item" refers to each of the values in a list.
+    elif keys[0] == 'item' and isinstance(value, list):
+        for item in value:
+            yield from _walk(item, keys[1:])
+
+    # Otherwise follow the key (if present).
+    elif isinstance(value, dict) and keys[0] in value:
+        yield from _walk(value[keys[0]], keys[1:])